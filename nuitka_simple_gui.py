@@ -1,23 +1,46 @@
+import argparse
 import ast
+import codecs
+import collections
+import csv
+import functools
+import hashlib
+import heapq
+import hmac
 import inspect
+import ipaddress
 import itertools
 import json
 import os
 import platform
 import re
+import secrets
+import select
 import shutil
 import subprocess
 import sys
+import sysconfig
+import tarfile
+import tempfile
 import threading
+import time
 import traceback
 import typing
+import urllib.error
+import urllib.request
 import zipfile
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
 
 import FreeSimpleGUI as sg
-from nuitka.plugins.Plugins import loadPlugins, plugin_name2plugin_classes
 from nuitka.utils.AppDirs import getCacheDir
-from nuitka.utils.Download import getCachedDownloadedMinGW64
 
 __version__ = "2026.01.31"
 sg.theme("default1")
@@ -26,20 +49,16 @@ _sys = platform.system()
 IS_WIN32 = _sys == "Windows"
 IS_MAC = _sys in {"OSX", "Darwin"}
 IS_LINUX = _sys == "Linux"
-loadPlugins()
-_plugins_list = {
-    k: getattr(v[0], "plugin_desc", "")
-    for k, v in plugin_name2plugin_classes.items()
-    if not v[0].isDeprecated()
-}
-plugins_checkbox = {i: False for i in sorted(_plugins_list)}
+_plugins_list: dict = {}
+plugins_checkbox: dict = {}
 cmd_list: list = []
 pip_args: list = []
 pip_cmd: list = []
 file_path: Path = Path("app")
 output_path = Path("./nuitka_output")
-STOPPING_PROC = False
-RUNNING_PROC: typing.Optional[subprocess.Popen] = None
+RUNNING_JOB: typing.Optional["BuildJob"] = None
+WATCH_STOP: typing.Optional[threading.Event] = None
+COMPILING: list = []
 values_cache: dict = {}
 python_exe_path = Path(sys.executable).as_posix()
 if python_exe_path.endswith("pythonw"):
@@ -50,12 +69,176 @@ non_cmd_events = {"dump_config", "load_config", "--onefile-tempdir-spec"}
 non_cmd_prefix = "____"
 window: sg.Window = None
 nuitka_cache_path = Path(getCacheDir("")).absolute()
+app_cache_path = nuitka_cache_path / "simple_gui"
+pip_cache_path = app_cache_path / "pips"
+plugin_cache_path = app_cache_path / "plugins.json"
+probe_cache_path = app_cache_path / "probe.json"
+import_cache_path = app_cache_path / "imports.json"
+resource_history_path = app_cache_path / "resources.json"
+compile_history_path = app_cache_path / "compile.json"
+artifact_store_path = app_cache_path / "store"
+upx_cache_path = app_cache_path / "upx"
+prebuilt_cache_path = app_cache_path / "modules"
+PIP_CACHE_SIZE = 10 * 1024**3
+NUITKA_CACHE_SIZE = 20 * 1024**3
+IMPORT_SCAN_PROCESS_MIN = 64
+LOG_CHUNK_SIZE = 64 * 1024
+LOG_MAX_LINES = 5000
+LOG_FRAME_MS = 100
+LOG_FILE_SIZE = 50 * 1024**2
+# seconds between SIGTERM and SIGKILL on cancel
+KILL_TIMEOUT = 3
+# run the children in their own process group, to kill the whole tree at once
+POPEN_GROUP: dict = (
+    {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    if IS_WIN32
+    else {"start_new_session": True}
+)
+STARTUP_TIMEOUT = 30
+IMPORT_SLOW_US = 20_000
+WATCH_POLL = 1.0
+WATCH_DEBOUNCE = 0.5
+SERVICE_ADDRESS = ("127.0.0.1", 8765)
+SERVICE_HISTORY = 100
+# IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+INOTIFY_MASK = 0x2 | 0x4 | 0x8 | 0x40 | 0x80 | 0x100 | 0x200
+# plugin name -> the package it is for, when they differ
+PLUGIN_PACKAGES = {
+    "tk-inter": "tkinter",
+    "pyqt5": "PyQt5",
+    "pyqt6": "PyQt6",
+    "pyside2": "PySide2",
+    "pyside6": "PySide6",
+    "pywebview": "webview",
+    "pmw-freezer": "Pmw",
+}
+# nuitka progress output -> build stage
+NUITKA_STAGES = [
+    ("Starting Python compilation", "optimization"),
+    ("Generating source code for C backend", "c_codegen"),
+    ("Running C compilation via Scons", "c_compile"),
+    ("Backend C linking", "c_link"),
+    ("Creating single file from dist folder", "onefile"),
+]
+CACHE_KINDS = {
+    "ccache": "ccache",
+    "clcache": "ccache",
+    "downloads": "downloads",
+    "onefile": "onefile",
+    "module-cache": "bytecode",
+    "bytecode": "bytecode",
+    "simple_gui": "simple_gui",
+}
 download_mingw_urls: list = []
+CCACHE_LOCATIONS = [
+    "/usr/local/bin/ccache",
+    "/opt/homebrew/bin/ccache",
+    "/opt/local/bin/ccache",
+    "/usr/lib/ccache/bin/ccache",
+]
+# nuitka reports the ccache / clcache results after the C compilation
+CCACHE_RESULT = re.compile(
+    r"Cached C files \(using ccache\) with result '([^']+)': (\d+)"
+)
+CCACHE_SIZE_UNITS = {"": 1, "K": 1000, "M": 1000**2, "G": 1000**3, "T": 1000**4}
+CCACHE_SIZE_UNITS.update(KI=1024, MI=1024**2, GI=1024**3, TI=1024**4)
+CLCACHE_RESULT = re.compile(
+    r"using clcache with (\d+) cache hits and (\d+) cache misses"
+)
+# the same options as the upx plugin of nuitka
+UPX_ARGS = ["-q", "--no-progress", "--best", "--lzma"]
+UPX_MIN_SIZE = 64 * 1024
+# keep the original when packing saves less, or unpacking costs more
+UPX_MAX_RATIO = 0.9
+UPX_MAX_UNPACK_MS = 50
+# ELF, PE, Mach-O 32 / 64 / fat
+EXECUTABLE_MAGIC = (
+    b"\x7fELF",
+    b"MZ",
+    b"\xce\xfa\xed\xfe",
+    b"\xcf\xfa\xed\xfe",
+    b"\xca\xfe\xba\xbe",
+)
+# options changing the compiler or its flags, which invalidate the cached objects
+C_FLAG_PREFIXES = (
+    "--clang",
+    "--mingw64",
+    "--msvc",
+    "--lto",
+    "--static-libpython",
+    "--debug",
+    "--unstripped",
+    "--python-flag",
+)
+COMPRESS_FORMATS = ["zip", "tar.zst", "tar.xz"]
+# already compressed payloads, stored in zip without recompression
+STORED_SUFFIXES = {
+    ".pyd", ".so", ".dll", ".dylib", ".whl", ".zip", ".gz", ".bz2", ".xz",
+    ".zst", ".7z", ".png", ".jpg", ".jpeg", ".gif", ".webp", ".ico", ".mp3",
+    ".mp4",
+}  # fmt: skip
+# zip entries are read ahead on a thread pool, the bigger files are streamed
+ZIP_READ_AHEAD_FILE = 16 * 1024**2
+ZIP_READ_AHEAD_BYTES = 256 * 1024**2
+
+
+# name: (source, required module, extra window values)
+BENCH_APPS = {
+    "cli": (
+        """import argparse, json, collections
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=1000)
+    args = parser.parse_args()
+    counter = collections.Counter(str(i % 7) for i in range(args.n))
+    print(json.dumps(counter))
+
+
+if __name__ == "__main__":
+    main()
+""",
+        "",
+        {},
+    ),
+    "tk": (
+        """import tkinter
+
+root = tkinter.Tk()
+tkinter.Label(root, text="bench").pack()
+root.after(0, root.destroy)
+root.mainloop()
+""",
+        "tkinter",
+        {"_plugin_tk-inter": True},
+    ),
+    "numpy": (
+        """import numpy
+
+a = numpy.random.rand(200, 200)
+print(float((a @ a.T).trace()))
+""",
+        "numpy",
+        {"--nofollow-imports": False},
+    ),
+}
+# the defaults of the window
+BENCH_BASE_VALUES = {
+    "--standalone": True,
+    "--nofollow-imports": True,
+    "--remove-output": True,
+    "--no-pyi-file": True,
+}
+BENCH_MATRIX = {"--onefile": [False, True]}
+BENCH_STARTUP_RUNS = 5
 
 
 def init_download_urls():
     if download_mingw_urls:
         return
+    from nuitka.utils.Download import getCachedDownloadedMinGW64
+
     source_code = inspect.getsource(getCachedDownloadedMinGW64)
     tree = ast.parse(source_code)
 
@@ -76,14 +259,120 @@ def init_download_urls():
     download_mingw_urls.extend(extractor.urls)
 
 
-def ensure_python_path():
-    global python_exe_path
-    title = ""
-    msg = ""
+def _plugin_cache_key():
+    import nuitka
+    from nuitka.Version import getNuitkaVersion
+
+    root = Path(nuitka.__file__).parent
+    return {
+        "version": getNuitkaVersion(),
+        "path": root.as_posix(),
+        "mtime": (root / "plugins").stat().st_mtime_ns,
+    }
+
+
+def refresh_plugin_cache():
+    "Load the nuitka plugins (slow), and save their metadata to plugin_cache_path."
+    from nuitka.plugins.Plugins import loadPlugins, plugin_name2plugin_classes
+
+    loadPlugins()
+    plugins = {
+        k: {
+            "desc": getattr(v[0], "plugin_desc", ""),
+            "deprecated": bool(v[0].isDeprecated()),
+        }
+        for k, v in plugin_name2plugin_classes.items()
+    }
+    data = {"key": _plugin_cache_key(), "plugins": plugins}
+    plugin_cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # the GUI and the service may refresh it from several threads
+    tmp = plugin_cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    os.replace(tmp, plugin_cache_path)
+    return plugins
+
+
+def init_plugins():
+    "Fill the plugin list from the disk cache, return True if it needs a refresh."
+    stale = False
+    try:
+        data = json.loads(plugin_cache_path.read_text(encoding="utf-8"))
+        plugins = data["plugins"]
+        stale = data["key"] != _plugin_cache_key()
+    except (OSError, ValueError, KeyError):
+        plugins = refresh_plugin_cache()
+    _plugins_list.clear()
+    _plugins_list.update(
+        {k: v["desc"] for k, v in plugins.items() if not v["deprecated"]}
+    )
+    plugins_checkbox.clear()
+    plugins_checkbox.update({i: False for i in sorted(_plugins_list)})
+    return stale
+
+
+def refresh_stale_plugins():
+    plugins = refresh_plugin_cache()
+    names = {k for k, v in plugins.items() if not v["deprecated"]}
+    added = sorted(names - set(_plugins_list))
+    removed = sorted(set(_plugins_list) - names)
+    if added or removed:
+        print(
+            f"Nuitka plugins changed (added: {added}, removed: {removed}), "
+            "restart to refresh the Plugins frame.",
+            flush=True,
+        )
+
+
+def _probe_tools():
+    tools = {}
+    for name in ["gcc", "clang", "ccache"]:
+        path = shutil.which(name)
+        if not path:
+            continue
+        try:
+            output = subprocess.run(
+                [path, "--version"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                timeout=10,
+            ).stdout
+            version = output.decode("utf-8", "replace").strip().splitlines()[0]
+        except (OSError, subprocess.TimeoutExpired, IndexError):
+            continue
+        tools[name] = {"path": Path(path).as_posix(), "version": version}
+    return tools
+
+
+def _probe_key(python_exe: str):
+    # --python may be a bare name like python3
+    path = Path(shutil.which(python_exe) or python_exe).absolute()
+    version = ""
+    # python_exe_path is sys.executable without the w of pythonw
+    if path.resolve() in {
+        Path(sys.executable).resolve(),
+        Path(python_exe_path).resolve(),
+    }:
+        # free in this process, the other interpreters are keyed by their mtime
+        from nuitka.Version import getNuitkaVersion
+
+        version = getNuitkaVersion()
+    return f"{path.as_posix()}|{path.stat().st_mtime_ns}|{version}"
+
+
+def probe_python(python_exe: str, refresh=False) -> dict:
+    "`python -m nuitka --version` and the C compilers, cached in probe_cache_path."
+    key = ""
+    try:
+        key = _probe_key(python_exe)
+        cache = json.loads(probe_cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = {}
+    if not refresh and key and key in cache:
+        return cache[key]
     try:
         output = b""
         with subprocess.Popen(
-            [python_exe_path, "-m", "nuitka", "--version"],
+            [python_exe, "-m", "nuitka", "--version"],
             stdout=subprocess.PIPE,
             stdin=subprocess.PIPE,
             stderr=subprocess.STDOUT,
@@ -97,10 +386,47 @@ def ensure_python_path():
         output = b""
     text = output.decode(sys.getdefaultencoding(), "replace")
     text = re.sub(r"[\r\n]+", "\n", text)
+    match = re.search(r"^Version C compiler: (.*?)\.?$", text, re.M)
+    result = {
+        "text": text,
+        "gcc_ready": bool(text) and "Is it OK to download and put it in" not in text,
+        "c_compiler": match.group(1) if match else "",
+        "tools": _probe_tools(),
+    }
+    if result["gcc_ready"] and key:
+        # missing gcc should be probed again after downloading
+        cache[key] = result
+        probe_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # --pythons probes in parallel threads
+        tmp = probe_cache_path.with_suffix(
+            f".{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+        os.replace(tmp, probe_cache_path)
+    return result
+
+
+def start_probe():
+    def _probe():
+        try:
+            result = probe_python(python_exe_path)
+        except Exception:
+            result = {"text": "", "error": traceback.format_exc()}
+        window.write_event_value("probe_done", result)
+
+    threading.Thread(target=_probe, daemon=True).start()
+
+
+def ensure_python_path(probe: dict):
+    title = ""
+    msg = ""
+    text = probe["text"]
     if text:
-        gcc_ready = "Is it OK to download and put it in" not in text
-        if gcc_ready:
-            return f"Nuitka version: {text}"
+        if probe["gcc_ready"]:
+            print(f"Nuitka version: {text}", flush=True)
+            for name, tool in probe["tools"].items():
+                print(f"{name}: {tool['version']}", flush=True)
+            return True
         else:
             title = "Missing gcc"
             msg = (
@@ -139,18 +465,572 @@ def ensure_python_path():
                     sg.PopupOK(f"Failed to download gcc {e}")
             else:
                 pass
+        return True
     else:
-        quit()
+        return False
 
 
 def get_dir_size(path: Path):
-    total = 0
-    for entry in path.iterdir():
-        if entry.is_file():
-            total += entry.stat().st_size
-        elif entry.is_dir():
-            total += get_dir_size(entry)
-    return total
+    return sum(size for items in scan_cache(path).values() for _, size, _ in items)
+
+
+def cache_kind(name: str):
+    name = name.lower()
+    for prefix, kind in CACHE_KINDS.items():
+        if name.startswith(prefix):
+            return kind
+    return name
+
+
+def _scan_dir(path: str):
+    files: list = []
+    dirs: list = []
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return files, dirs
+    with it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    st = entry.stat(follow_symlinks=False)
+                    # noatime mounts never update st_atime
+                    last_used = max(st.st_atime, st.st_mtime)
+                    files.append((last_used, st.st_size, entry.path))
+            except OSError:
+                continue
+    return files, dirs
+
+
+def scan_cache(root: Path, workers: int = 0) -> dict:
+    "{kind: [(last_used, size, path)]} of the files under root, scanned in parallel."
+    result: dict = collections.defaultdict(list)
+    workers = workers or min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_scan_dir, str(root)): ""}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind = pending.pop(future)
+                files, dirs = future.result()
+                result[kind or "other"].extend(files)
+                for path in dirs:
+                    _kind = kind or cache_kind(os.path.basename(path))
+                    pending[pool.submit(_scan_dir, path)] = _kind
+    return result
+
+
+def cache_report(root: Path, scan: dict):
+    total = sum(size for items in scan.values() for _, size, _ in items)
+    lines = [f"{root}: {total / 1024**3:.1f} GB"]
+    sizes = {kind: sum(i[1] for i in items) for kind, items in scan.items() if items}
+    for kind, size in sorted(sizes.items(), key=lambda i: -i[1]):
+        lines.append(
+            f"  {kind:<20}{size / 1024**3:>8.2f} GB {len(scan[kind]):>10} files"
+        )
+    return "\n".join(lines)
+
+
+def cache_entry(root: Path, path: str, kind: str):
+    "The unit of eviction: a whole toolchain of downloads, else a top-level item."
+    parts = Path(path).relative_to(root).parts
+    if kind == "simple_gui":
+        # simple_gui/upx/<settings>/<digest> and simple_gui/modules/<key>, the pips
+        # have their own LRU and the store is evicted by builds
+        depth = {"upx": 4, "modules": 3}.get(parts[1], 0) if len(parts) > 2 else 0
+        # .tmp: being written by a build
+        if not depth or len(parts) < depth or parts[depth - 1].endswith(".tmp"):
+            return None
+        return root.joinpath(*parts[:depth])
+    # downloads/<tool>/<version or arch>, a partly removed one still looks installed
+    depth = 3 if kind == "downloads" else 2
+    return root.joinpath(*parts[:depth])
+
+
+def ccache_trim(root: Path, limit: int, log=None):
+    "Set the max size of the ccache dirs (split by their sizes) and clean them up."
+    log = log or print_log
+    dirs = [i for i in (root / "ccache").glob("*") if i.is_dir()]
+    ccache = find_ccache()
+    if not dirs or not ccache:
+        return 0
+    sizes = {path: get_dir_size(path) for path in dirs}
+    total = sum(sizes.values()) or 1
+    freed = 0
+    for path, size in sizes.items():
+        # ccache keeps the limit in its ccache.conf, and keeps itself under it
+        mb = max(limit * size // total // 1000**2, 1)
+        env = dict(os.environ, CCACHE_DIR=str(path))
+        try:
+            for args in (["-M", f"{mb}M"], ["-c"]):
+                subprocess.run(
+                    [ccache, *args], env=env, capture_output=True, check=True
+                )
+        except (OSError, subprocess.CalledProcessError) as error:
+            log(f"ccache -M failed in {path.as_posix()}: {error}\n")
+            continue
+        after = ccache_size(ccache, path)
+        freed += size - (get_dir_size(path) if after is None else after)
+    return freed
+
+
+def cache_gc(scan: dict, limit: int, root: Path = nuitka_cache_path, log=None):
+    "Remove the least recently used entries until the cache fits in limit bytes."
+    total = sum(size for items in scan.values() for _, size, _ in items)
+    entries: dict = {}
+    for kind, items in scan.items():
+        # ccache limits itself
+        if kind == "ccache":
+            continue
+        for last_used, size, path in items:
+            entry = cache_entry(root, path, kind)
+            if entry is None:
+                continue
+            _last_used, _size = entries.get(entry, (0, 0))
+            entries[entry] = (max(_last_used, last_used), _size + size)
+    # a stored build frees only the blobs no other build uses, the newest one
+    # of each name is kept
+    store = root / "simple_gui" / "store"
+    manifests = _store_manifests(store)
+    newest = {i["name"]: i["id"] for i in manifests}
+    for manifest in manifests:
+        if manifest["id"] != newest[manifest["name"]]:
+            entries[manifest["id"]] = (manifest["created"], 0)
+    removed = freed = 0
+    ccache_bytes = sum(size for _, size, _ in scan.get("ccache", ()))
+    others = total - ccache_bytes
+    # the C objects get what the other caches leave, but at least half
+    ccache_limit = max(limit - others, limit // 2)
+    if total > limit and ccache_bytes > ccache_limit:
+        freed = ccache_trim(root, ccache_limit, log)
+        total -= freed
+    for entry, (_, size) in sorted(entries.items(), key=lambda i: i[1][0]):
+        if total <= limit:
+            break
+        try:
+            if isinstance(entry, str):
+                size = store_gc(store, remove=[entry])
+            elif entry.is_dir() and not entry.is_symlink():
+                shutil.rmtree(entry)
+            else:
+                os.remove(entry)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+        freed += size
+    return removed, freed
+
+
+def show_nuitka_cache(gc_limit: int = 0):
+    start = time.perf_counter()
+    scan = scan_cache(nuitka_cache_path)
+    print(cache_report(nuitka_cache_path, scan), flush=True)
+    if gc_limit:
+        removed, freed = cache_gc(scan, gc_limit)
+        print(
+            f"gc: removed {removed} entries, {freed / 1024**3:.2f} GB freed "
+            f"(limit {gc_limit / 1024**3:.1f} GB)",
+            flush=True,
+        )
+    print(f"cost: {time.perf_counter() - start:.1f}s", flush=True)
+
+
+def cli_cache(argv: list):
+    parser = argparse.ArgumentParser(
+        prog="nuitka_simple_gui cache",
+        description=f"Show the size of {nuitka_cache_path} by cache kind.",
+    )
+    parser.add_argument(
+        "--gc",
+        type=float,
+        default=0,
+        help="remove least recently used files down to this many GB",
+    )
+    args = parser.parse_args(argv)
+    show_nuitka_cache(int(args.gc * 1024**3))
+    return 0
+
+
+@functools.lru_cache()
+def python_info(python_exe: str):
+    if Path(python_exe).absolute() == Path(sys.executable).absolute():
+        return f"{sys.version}\n{platform.platform()}"
+    output = subprocess.check_output(
+        [
+            python_exe,
+            "-c",
+            "import sys, platform;print(sys.version);print(platform.platform())",
+        ],
+    )
+    return output.decode("utf-8", "replace").strip()
+
+
+@functools.lru_cache()
+def nuitka_version(python_exe: str):
+    if Path(python_exe).absolute() == Path(sys.executable).absolute():
+        from nuitka.Version import getNuitkaVersion
+
+        return getNuitkaVersion()
+    output = subprocess.check_output(
+        [
+            python_exe,
+            "-c",
+            "from nuitka.Version import getNuitkaVersion;print(getNuitkaVersion())",
+        ],
+    )
+    return output.decode("utf-8", "replace").strip()
+
+
+def _find_local_module(base: Path, parts: list):
+    found = []
+    for part in parts:
+        base = base / part
+        if (base / "__init__.py").is_file():
+            found.append(base / "__init__.py")
+        elif base.with_suffix(".py").is_file():
+            found.append(base.with_suffix(".py"))
+            break
+        elif not base.is_dir():
+            break
+    return found
+
+
+def _parse_imports(path: str):
+    "[(module, level, names)] of the import statements and import_module('x') calls."
+    try:
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), path)
+    except (OSError, SyntaxError, ValueError):
+        return []
+    imports = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.extend((alias.name, 0, []) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            names = [alias.name for alias in node.names if alias.name != "*"]
+            imports.append((node.module or "", node.level, names))
+        elif (
+            isinstance(node, ast.Call)
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+            and isinstance(node.args[0].value, str)
+            and not node.args[0].value.startswith(".")
+        ):
+            func = node.func
+            name = func.attr if isinstance(func, ast.Attribute) else ""
+            name = name or getattr(func, "id", "")
+            if name in {"import_module", "__import__"}:
+                imports.append((node.args[0].value, 0, []))
+    return imports
+
+
+def read_imports(paths: list, cache: dict, workers: int = 0):
+    "{path: imports}, cached by mtime & size, then by sha1 if only the mtime changed."
+    result = {}
+    misses = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        key = path.as_posix()
+        stamp = [st.st_mtime_ns, st.st_size]
+        item = cache.get(key)
+        if item and item["stamp"] == stamp:
+            result[path] = item["imports"]
+            continue
+        sha1 = hashlib.sha1(path.read_bytes()).hexdigest()
+        if item and item["sha1"] == sha1:
+            item["stamp"] = stamp
+            result[path] = item["imports"]
+            continue
+        cache[key] = {"stamp": stamp, "sha1": sha1, "imports": []}
+        misses.append(path)
+    keys = [path.as_posix() for path in misses]
+    if len(misses) >= IMPORT_SCAN_PROCESS_MIN:
+        # ast.parse holds the GIL
+        with ProcessPoolExecutor(max_workers=workers or None) as pool:
+            parsed = list(pool.map(_parse_imports, keys, chunksize=16))
+    else:
+        parsed = [_parse_imports(key) for key in keys]
+    for path, key, imports in zip(misses, keys, parsed):
+        cache[key]["imports"] = imports
+        result[path] = imports
+    return result
+
+
+def scan_import_graph(entry: Path, workers: int = 0):
+    "The local modules reachable from entry (edges) and the other imported names."
+    entry = entry.absolute()
+    root = entry.parent
+    try:
+        cache = json.loads(import_cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = {}
+    edges: dict = {}
+    external = set()
+    seen = {entry}
+    frontier = [entry]
+    while frontier:
+        imports = read_imports(frontier, cache, workers)
+        frontier = []
+        for path, items in imports.items():
+            found = []
+            for module, level, names in items:
+                base = root
+                if level:
+                    if level > len(path.parents):
+                        continue
+                    base = path.parents[level - 1]
+                parts = module.split(".") if module else []
+                local = _find_local_module(base, parts)
+                for name in names:
+                    local.extend(_find_local_module(base, parts + [name]))
+                if not level and not local and parts:
+                    # from x import y: y may be a submodule
+                    external.add(module)
+                    external.update(f"{module}.{name}" for name in names)
+                found.extend(local)
+            edges[path] = set(found)
+            for _path in found:
+                if _path not in seen:
+                    seen.add(_path)
+                    frontier.append(_path)
+    import_cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # parallel builds are threads of one process
+    tmp = import_cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(cache), encoding="utf-8")
+    os.replace(tmp, import_cache_path)
+    return {"root": root, "entry": entry, "edges": edges, "external": external}
+
+
+def local_imports(entry: Path):
+    "The local .py files reachable from entry by import statements."
+    return set(scan_import_graph(entry)["edges"])
+
+
+def _module_name(root: Path, path: Path):
+    parts = list(path.relative_to(root).with_suffix("").parts)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def _is_stdlib(name: str):
+    if name in sys.builtin_module_names or name == "__future__":
+        return True
+    names = getattr(sys, "stdlib_module_names", None)
+    if names is not None:
+        return name in names
+    from importlib.util import find_spec
+
+    spec = find_spec(name)
+    stdlib = Path(sysconfig.get_paths()["stdlib"])
+    return bool(spec and spec.origin and stdlib in Path(spec.origin).parents)
+
+
+# run by the python of the build: {imported name: the deepest module of it found},
+# submodules are looked up in the package dirs without importing the packages
+RESOLVE_MODULES_SCRIPT = """
+import json, sys, sysconfig
+from importlib.machinery import PathFinder
+from importlib.util import find_spec
+
+stdlib = getattr(sys, "stdlib_module_names", None)
+stdlib_dir = sysconfig.get_paths()["stdlib"]
+found = {}
+for name in json.loads(sys.stdin.read()):
+    parts = name.split(".")
+    top = parts[0]
+    if top in sys.builtin_module_names or top == "__future__":
+        continue
+    elif stdlib is not None and top in stdlib:
+        continue
+    try:
+        spec = find_spec(top)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None:
+        continue
+    origin = spec.origin or ""
+    if stdlib is None and origin.startswith(stdlib_dir) and "-packages" not in origin:
+        continue
+    module = top
+    for part in parts[1:]:
+        if not spec.submodule_search_locations:
+            break
+        spec = PathFinder.find_spec(
+            module + "." + part, list(spec.submodule_search_locations)
+        )
+        if spec is None:
+            break
+        module += "." + part
+    found[name] = module
+print(json.dumps(found))
+"""
+
+
+def resolve_modules(names: list, python_exe: str = "", cwd: Path = Path(".")):
+    "{name: module} of the third-party names importable by python_exe."
+    output = subprocess.run(
+        [python_exe or python_exe_path, "-c", RESOLVE_MODULES_SCRIPT],
+        input=json.dumps(names).encode("utf-8"),
+        cwd=cwd,
+        capture_output=True,
+        check=True,
+        timeout=60,
+    ).stdout
+    return json.loads(output)
+
+
+def propose_includes(graph: dict, with_external=True, python_exe: str = ""):
+    "The smallest (--include-package, --include-module) lists for the import graph."
+    root = graph["root"]
+    reached = collections.defaultdict(set)
+    for path in graph["edges"]:
+        if path == graph["entry"] or root not in path.parents:
+            continue
+        name = _module_name(root, path)
+        if name:
+            reached[name.split(".")[0]].add(name)
+    packages, modules = [], []
+    for top, names in reached.items():
+        pkg_dir = root / top
+        if pkg_dir.is_dir():
+            all_names = {_module_name(root, p) for p in pkg_dir.rglob("*.py")}
+            if all_names <= names:
+                packages.append(top)
+                continue
+        modules.extend(names)
+    if with_external and graph["external"]:
+        # the exact modules imported, as the python of the build finds them
+        found = set(
+            resolve_modules(sorted(graph["external"]), python_exe, root).values()
+        )
+        # a submodule brings its packages along
+        modules.extend(
+            i for i in found if not any(j.startswith(f"{i}.") for j in found)
+        )
+    return sorted(packages), sorted(modules)
+
+
+def cli_scan(argv: list):
+    parser = argparse.ArgumentParser(
+        prog="nuitka_simple_gui scan",
+        description="Propose --include-package / --include-module by the imports.",
+    )
+    parser.add_argument("entry", help="the entry point .py file")
+    parser.add_argument(
+        "--no-external",
+        action="store_true",
+        help="the third-party packages come from the pip args",
+    )
+    parser.add_argument(
+        "--python", default=python_exe_path, help="the python to build with"
+    )
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    graph = scan_import_graph(Path(args.entry))
+    packages, modules = propose_includes(graph, not args.no_external, args.python)
+    print(
+        f"{len(graph['edges'])} local modules, "
+        f"{len(graph['external'])} other imports, "
+        f"{time.perf_counter() - start:.2f}s",
+        flush=True,
+    )
+    for name in packages:
+        print(f"--include-package={name}", flush=True)
+    for name in modules:
+        print(f"--include-module={name}", flush=True)
+    return 0
+
+
+def pip_cache_key(pip_args: list, python_exe: str):
+    h = hashlib.sha256(python_info(python_exe).encode("utf-8"))
+    for arg in pip_args:
+        h.update(arg.encode("utf-8") + b"\0")
+        if Path(arg).is_file():
+            # requirements.txt / local wheels
+            h.update(Path(arg).read_bytes())
+    return h.hexdigest()[:32]
+
+
+def pip_cache_get(key: str) -> typing.Optional[Path]:
+    path = pip_cache_path / key
+    meta = pip_cache_path / f"{key}.json"
+    if path.is_dir() and meta.is_file():
+        # the mtime of meta file is the last access time for LRU
+        meta.touch()
+        return path
+    return None
+
+
+def pip_cache_put(key: str, src: Path, pip_args: list) -> Path:
+    path = pip_cache_path / key
+    pip_cache_path.mkdir(parents=True, exist_ok=True)
+    try:
+        src.rename(path)
+    except OSError:
+        # another build stored it first, or src is on another drive
+        if not path.is_dir():
+            # a private copy, parallel builds with the same key race on the rename
+            tmp = Path(tempfile.mkdtemp(suffix=".tmp", dir=pip_cache_path))
+            try:
+                shutil.copytree(src, tmp, dirs_exist_ok=True)
+                tmp.rename(path)
+            except OSError:
+                if not path.is_dir():
+                    raise
+            finally:
+                shutil.rmtree(tmp, ignore_errors=True)
+    meta = {"args": pip_args, "size": get_dir_size(path), "python": sys.version}
+    tmp_meta = pip_cache_path / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+    tmp_meta.write_text(json.dumps(meta))
+    os.replace(tmp_meta, pip_cache_path / f"{key}.json")
+    pip_cache_evict(keep=key)
+    return path
+
+
+def package_version(pip_dir: Path, name: str):
+    "Version of the distribution in pip_dir providing the top-level module name."
+    from importlib.metadata import distributions
+
+    for dist in distributions(path=[pip_dir.as_posix()]):
+        top_level = (dist.read_text("top_level.txt") or "").split()
+        files = {path.parts[0] for path in dist.files or ()}
+        if name in top_level or name in files or f"{name}.py" in files:
+            return dist.version
+    return ""
+
+
+def prebuilt_key(name: str, version: str, python_exe: str):
+    "Cache dir name of a package compiled by --module, for one python ABI & nuitka."
+    h = hashlib.sha256(python_info(python_exe).encode("utf-8"))
+    h.update(nuitka_version(python_exe).encode("utf-8"))
+    return f"{name}-{version}-{h.hexdigest()[:16]}"
+
+
+def pip_cache_evict(limit: int = 0, keep: str = ""):
+    limit = limit or PIP_CACHE_SIZE
+    items = []
+    for meta in pip_cache_path.glob("*.json"):
+        try:
+            size = json.loads(meta.read_text())["size"]
+            items.append((meta.stat().st_mtime, meta.stem, size))
+        except (OSError, ValueError, KeyError):
+            continue
+    total = sum(i[2] for i in items)
+    for _, key, size in sorted(items):
+        if total <= limit:
+            break
+        if key == keep:
+            continue
+        (pip_cache_path / f"{key}.json").unlink(missing_ok=True)
+        shutil.rmtree(pip_cache_path / key, ignore_errors=True)
+        total -= size
 
 
 def slice_by_size(seq, size):
@@ -161,6 +1041,107 @@ def slice_by_size(seq, size):
             yield it
 
 
+def _read_entry(path: Path):
+    "The bytes of a file to write, None for the dirs and the big files to stream."
+    if path.is_dir() or path.stat().st_size > ZIP_READ_AHEAD_FILE:
+        return None
+    return path.read_bytes()
+
+
+def is_stored_file(path: Path):
+    name = path.name.lower()
+    return path.suffix.lower() in STORED_SUFFIXES or ".so." in name
+
+
+def _tar_dir(src_dir: Path, target: Path, fmt: str, extra_files: dict):
+    tool = {
+        "tar.zst": ["zstd", "-10", "-T0", "-q", "-c"],
+        "tar.xz": ["xz", "-6", "-T0", "-c"],
+    }[fmt]
+    if not shutil.which(tool[0]):
+        if fmt == "tar.xz":
+            # single thread fallback
+            with tarfile.open(target, "w:xz") as tf:
+                tf.add(src_dir, src_dir.name)
+                for arcname, path in extra_files.items():
+                    tf.add(path, arcname)
+            return
+        raise ValueError(f"{tool[0]} not found, install it to create {fmt}")
+    with open(target, "wb") as f:
+        proc = subprocess.Popen(tool, stdin=subprocess.PIPE, stdout=f)
+        try:
+            with tarfile.open(fileobj=proc.stdin, mode="w|") as tf:
+                tf.add(src_dir, src_dir.name)
+                for arcname, path in extra_files.items():
+                    tf.add(path, arcname)
+        finally:
+            proc.stdin.close()
+            code = proc.wait()
+    if code != 0:
+        raise ValueError(f"{tool[0]} bad return code: {code}")
+
+
+def compress_dir(
+    src_dir: Path,
+    target: Path,
+    fmt: str = "zip",
+    extra_files: typing.Optional[dict] = None,
+    workers: int = 0,
+):
+    "Archive src_dir into target, zip entries are read ahead on a thread pool."
+    extra_files = extra_files or {}
+    if fmt != "zip":
+        return _tar_dir(src_dir, target, fmt, extra_files)
+    workers = workers or os.cpu_count() or 1
+    files = [
+        (file, file.relative_to(src_dir.parent).as_posix())
+        for file in sorted(src_dir.rglob("*"))
+    ]
+    files.extend((Path(path), arcname) for arcname, path in extra_files.items())
+    with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            pending: collections.deque = collections.deque()
+            held = 0
+
+            def _write_next():
+                nonlocal held
+                path, arcname, size, future = pending.popleft()
+                held -= size
+                data = future.result()
+                compress_type = (
+                    zipfile.ZIP_STORED if is_stored_file(path) else zipfile.ZIP_DEFLATED
+                )
+                if path.is_dir():
+                    zf.write(path, arcname)
+                elif data is None:
+                    # streamed from the disk by chunks
+                    zf.write(path, arcname, compress_type=compress_type)
+                else:
+                    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+                    zf.writestr(
+                        zinfo,
+                        data,
+                        compress_type=compress_type,
+                        compresslevel=zf.compresslevel,
+                    )
+
+            for path, arcname in files:
+                size = 0 if path.is_dir() else path.stat().st_size
+                size = 0 if size > ZIP_READ_AHEAD_FILE else size
+                pending.append((path, arcname, size, pool.submit(_read_entry, path)))
+                held += size
+                # bound the memory held by read but unwritten entries
+                while pending and (
+                    len(pending) >= workers * 4 or held > ZIP_READ_AHEAD_BYTES
+                ):
+                    _write_next()
+            while pending:
+                _write_next()
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+
 def input_path(text, key, action=sg.FileBrowse, disable_input=False):
     return [
         sg.Text(
@@ -254,7 +1235,7 @@ def init_checkbox():
             sg.InputText(
                 key="--jobs",
                 default_text="",
-                tooltip=f"default to {os.cpu_count()}",
+                tooltip=f"default to {os.cpu_count()}, `auto` to fit the memory by the last build",
                 size=(5, None),
                 enable_events=True,
             ),
@@ -303,25 +1284,39 @@ def update_disabled(k, v):
     if k == "--onefile":
         window["--onefile-tempdir-spec"].update(disabled=not v)
         window["is_compress"].update(disabled=v)
+        window["compress_format"].update(disabled=v)
         window["need_start_file"].update(disabled=v)
         window["tmp_cached"].update(disabled=not v)
+        window["startup_runs"].update(disabled=not v)
 
 
-def update_cmd(event, values):
-    # print(values)
-    global file_path, output_path
+def entry_points(values: dict):
+    "The Entry Point and the extra ones sharing its .dist, by `;` in entry_points."
+    paths = [Path(values.get("file_path") or file_path)]
+    for text in str(values.get("entry_points") or "").split(";"):
+        path = Path(text.strip())
+        if text.strip() and path not in paths:
+            paths.append(path)
+    return paths
+
+
+def make_cmd(values: dict, python_exe: str = ""):
+    "Build the nuitka & pip commands from the window values (or a config.json)."
+    python_exe = python_exe or python_exe_path
+    _file_path = Path(values.get("file_path") or file_path)
+    _output_path = Path(values.get("--output-dir") or output_path)
     cmd = [
-        python_exe_path,
+        python_exe,
         "-m",
         "nuitka",
     ]
+    _pip_cmd: list = []
     for k, v in values.items():
         k = str(k)
-        update_disabled(k, v)
         if k == "--onefile":
             if v:
                 cmd.append(k)
-                if values["--onefile-tempdir-spec"]:
+                if values.get("--onefile-tempdir-spec"):
                     p = values["--onefile-tempdir-spec"]
                     cmd.append(f"--onefile-tempdir-spec={p}")
                 tmp_cached = values.get("tmp_cached", False)
@@ -352,58 +1347,84 @@ def update_cmd(event, values):
                     p = Path(v).as_posix()
                     cmd.append(f"--macos-app-icon={p}")
                 elif k == "--output-dir":
-                    output_path = Path(v)
-                    cmd.append(f"--output-dir={output_path.as_posix()}")
+                    cmd.append(f"--output-dir={_output_path.as_posix()}")
                 elif k == "--output-filename":
                     _name = v.replace('"', "_").replace(" ", "_").replace("'", "_")
                     cmd.append(f"--output-filename={_name}")
-                    if event == k:
-                        window["--onefile-tempdir-spec"].update(f"./{_name}_cache")
                 elif k == "--other-args":
                     cmd.extend(v.split(","))
                 elif k == "--jobs":
                     cmd.append(f"--jobs={v}")
                 else:
                     cmd.append(k)
-            elif k == "file_path":
-                file_path = Path(v)
-                if event == k:
-                    window["--output-filename"].update(file_path.stem)
-                    window["--onefile-tempdir-spec"].update(f"./{file_path.stem}_cache")
             elif k == "pip_args":
                 if not v.strip():
                     continue
-                if event == k and Path(v).is_file():
+                if Path(v).is_file():
                     v = f"-r {v}"
-                    window["pip_args"].update(v)
-                args = v.split()
-                pip_args.clear()
-                pip_args.extend(args)
-                pip_cmd.clear()
-                pip_cmd.extend(
+                _pip_cmd.extend(
                     [
-                        python_exe_path,
+                        python_exe,
                         "-m",
                         "pip",
                         "install",
                     ]
                 )
-                pip_cmd.extend(pip_args)
-                pips_path = (output_path / f"{file_path.stem}.pips").as_posix()
-                pip_cmd.extend(["-t", pips_path])
+                _pip_cmd.extend(v.split())
+                pips_path = (_output_path / f"{_file_path.stem}.pips").as_posix()
+                _pip_cmd.extend(["-t", pips_path])
                 cmd.append(f"--include-raw-dir={pips_path}=./")
-        else:
-            if k == "pip_args":
-                pip_cmd.clear()
+                prebuilt = str(values.get("prebuilt") or "").split()
+                if prebuilt:
+                    # the compiled packages take the place of their pip sources
+                    _path = _output_path / f"{_file_path.stem}.prebuilt"
+                    cmd.append(f"--include-raw-dir={_path.as_posix()}=./")
+                    for name in prebuilt:
+                        cmd.append(f"--noinclude-data-files={name}/*.py")
+                        cmd.append(f"--noinclude-data-files={name}/*.pyc")
+                        cmd.append(f"--noinclude-data-files={name}.py")
     if IS_WIN32:
         from importlib.util import find_spec
 
         if find_spec("pywin32_bootstrap") is not None:
             cmd.extend(["--include-module=pywin32_bootstrap"])
-    for k, v in plugins_checkbox.items():
-        if v:
-            cmd.append("--enable-plugin=%s" % k)
-    cmd.append(file_path.as_posix())
+    for k, v in values.items():
+        if str(k).startswith("_plugin_") and v:
+            cmd.append("--enable-plugin=%s" % k[8:])
+    entries = entry_points(values)
+    if len(entries) > 1 and not values.get("--module"):
+        # multidist: one binary dispatching on its name, the modules compiled once
+        cmd.extend(f"--main={path.as_posix()}" for path in entries)
+    else:
+        cmd.append(_file_path.as_posix())
+    return cmd, _pip_cmd, _file_path, _output_path
+
+
+def update_cmd(event, values):
+    # print(values)
+    global file_path, output_path
+    for k, v in values.items():
+        update_disabled(str(k), v)
+    if values.get("file_path"):
+        file_path = Path(values["file_path"])
+        if event == "file_path":
+            window["--output-filename"].update(file_path.stem)
+            window["--onefile-tempdir-spec"].update(f"./{file_path.stem}_cache")
+    if values.get("--output-dir"):
+        output_path = Path(values["--output-dir"])
+    if event == "--output-filename" and values.get("--output-filename"):
+        _name = values["--output-filename"]
+        _name = _name.replace('"', "_").replace(" ", "_").replace("'", "_")
+        window["--onefile-tempdir-spec"].update(f"./{_name}_cache")
+    v = values.get("pip_args") or ""
+    if event == "pip_args" and v.strip() and Path(v).is_file():
+        window["pip_args"].update(f"-r {v}")
+    cmd, _pip_cmd, _, _ = make_cmd(values)
+    pip_args.clear()
+    pip_cmd.clear()
+    if _pip_cmd:
+        pip_args.extend(_pip_cmd[4:-2])
+        pip_cmd.extend(_pip_cmd)
     # print(subprocess.list2cmdline(cmd))
     text = f"[Python]:\n{sys.version}\n[Build]"
     if pip_cmd:
@@ -422,107 +1443,2720 @@ def update_plugin_list(e, items):
             plugins_checkbox[key] = v
 
 
+def sep_line(text: str):
+    return "\n==================== %s ====================\n\n" % text.center(20, " ")
+
+
+def print_log(text: str):
+    print(text, end="", flush=True)
+
+
 def print_sep(text: str):
-    print(
-        "\n==================== %s ====================\n\n" % text.center(20, " "),
-        end="",
-        flush=True,
-    )
+    print_log(sep_line(text))
 
 
-def start_build():
-    global RUNNING_PROC, STOPPING_PROC
-    window["Start"].update(disabled=True)
-    window["Cancel"].update(disabled=False)
-    try:
-        output_path.mkdir(parents=True, exist_ok=True)
-        if pip_args:
-            print_sep('"pip install" Start')
-            print(pip_args, flush=True)
-            RUNNING_PROC = subprocess.Popen(
-                pip_cmd,
-                # shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-            )
-            for line in RUNNING_PROC.stdout:
-                print(line.decode("utf-8", "replace"), end="", flush=True)
-                if STOPPING_PROC:
-                    RUNNING_PROC.kill()
-                    break
-            code = RUNNING_PROC.wait()
-            if code != 0:
-                raise ValueError("Bad return code: %s" % code)
-            print_sep('"pip install" Finished')
-        print_sep("Build Start")
-        RUNNING_PROC = subprocess.Popen(
-            cmd_list,
-            shell=True,
-            # creationflags=subprocess.CREATE_NO_WINDOW,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-        )
-        for line in RUNNING_PROC.stdout:
-            print(line.decode("utf-8", "replace"), end="", flush=True)
-            if STOPPING_PROC:
-                RUNNING_PROC.kill()
-                break
-        code = RUNNING_PROC.wait()
-        if code != 0:
-            raise ValueError("Bad return code: %s" % code)
-        print_sep("Build Success")
-        app_name = file_path.stem
-        if values_cache["need_start_file"] and not window["need_start_file"].Disabled:
-            with open(output_path / f"{app_name}.bat", "w", encoding="utf-8") as f:
-                f.write(f"@echo off\ncd {app_name}.dist\nstart /B {app_name}")
-        if values_cache["is_compress"] and not window["is_compress"].Disabled:
-            print_sep("Compress Start")
-            src_dir = output_path / f"{file_path.stem}.dist"
-            if src_dir.is_dir():
-                target = output_path / f"{file_path.stem}.zip"
-                with zipfile.ZipFile(
-                    target, "w", zipfile.ZIP_DEFLATED, compresslevel=9
-                ) as zf:
-                    for file in src_dir.rglob("*"):
-                        zf.write(file, file.relative_to(src_dir.parent))
-                    if values_cache["need_start_file"]:
-                        zf.write(output_path / f"{app_name}.bat", f"{app_name}.bat")
-                print_sep("Compress Finished")
-            else:
-                print(src_dir.absolute().as_posix(), "is_dir:", src_dir.is_dir())
-                print_sep("Compress Skipped")
-        print_sep("Mission Completed")
-        if IS_WIN32:
-            beep()
+def _survivors(pgid: int, tree: typing.Iterable = ()):
+    "The running pids of the process group and the tree, zombies count as dead."
+    if not os.path.isdir("/proc"):
+        try:
+            os.killpg(pgid, 0)
+            return [pgid]
+        except OSError:
+            return []
+    tree = set(tree)
+    alive = []
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat", "rb") as f:
+                data = f.read()
+            state, _, pgrp = data[data.rindex(b")") + 2 :].split()[:3]
+        except (OSError, ValueError):
+            continue
+        if state != b"Z" and (int(pgrp) == pgid or int(name) in tree):
+            alive.append(int(name))
+    return alive
 
-    except Exception:
-        traceback.print_exc()
-        print_sep("Error")
-    finally:
-        shutil.rmtree(
-            (output_path / f"{file_path.stem}.pips").as_posix(), ignore_errors=True
+
+def kill_proc_tree(proc: subprocess.Popen, timeout: float = KILL_TIMEOUT):
+    "Kill proc (started with POPEN_GROUP) and its descendants, return the survivors."
+    if IS_WIN32:
+        subprocess.call(
+            ["taskkill", "/T", "/F", "/PID", str(proc.pid)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
+        try:
+            proc.wait(timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        return [] if proc.poll() is not None else [proc.pid]
+    import signal
 
-    RUNNING_PROC = None
-    window["Start"].update(disabled=False)
-    window["Cancel"].update(disabled=True)
-    STOPPING_PROC = False
+    # the descendants which left the process group are killed by pid
+    tree = _proc_tree(proc.pid, _read_proc_stats()) if os.path.isdir("/proc") else []
+    alive = _survivors(proc.pid, tree)
+    for sig in [signal.SIGTERM, signal.SIGKILL]:
+        for pid in alive:
+            try:
+                os.kill(pid, sig)
+            except OSError:
+                pass
+        deadline = time.monotonic() + timeout
+        while alive and time.monotonic() < deadline:
+            time.sleep(0.05)
+            # reap the leader, or it stays as a zombie
+            proc.poll()
+            alive = _survivors(proc.pid, tree)
+        if not alive:
+            break
+    return alive
 
 
-def beep():
-    import ctypes
+class LogFile:
+    "Stream the build log to disk, the previous logs are rotated to .1, .2 ..."
 
-    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
-    frequency = 800
-    duration = 200
-    for _ in range(3):
-        kernel32.Beep(frequency, duration)
+    def __init__(self, path: Path, max_bytes: int = 0, backups: int = 3):
+        self.path = path
+        self.max_bytes = max_bytes or LOG_FILE_SIZE
+        self.backups = backups
+        if path.is_file() and path.stat().st_size:
+            self.rotate()
+        self.file = open(path, "w", encoding="utf-8")
+        self.flushed = time.monotonic()
+        # pip and nuitka write from two threads when they overlap
+        self.lock = threading.Lock()
 
+    def rotate(self):
+        for i in range(self.backups - 1, 0, -1):
+            src = self.path.with_name(f"{self.path.name}.{i}")
+            if src.is_file():
+                os.replace(src, self.path.with_name(f"{self.path.name}.{i + 1}"))
+        os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
 
-def main():
-    layout = [
-        input_path("Entry Point:", "file_path", disable_input=True),
-        [
+    def write(self, text: str):
+        with self.lock:
+            if self.file.closed:
+                return
+            self.file.write(text)
+            if time.monotonic() - self.flushed > 1:
+                self.file.flush()
+                self.flushed = time.monotonic()
+                if self.file.tell() > self.max_bytes:
+                    self.file.close()
+                    self.rotate()
+                    self.file = open(self.path, "w", encoding="utf-8")
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+
+class LogPump:
+    "The sys.stdout of the window: buffer writes from any thread, show a bounded tail."
+
+    def __init__(self, element: sg.Multiline, max_lines: int = 0):
+        self.element = element
+        self.max_lines = max_lines or LOG_MAX_LINES
+        self.pending: collections.deque = collections.deque()
+        self.size = 0
+        self.lock = threading.Lock()
+
+    def write(self, text: str):
+        with self.lock:
+            self.pending.append(text)
+            self.size += len(text)
+            # the window is busy, only the tail will be shown anyway
+            while self.size > self.max_lines * 200 and len(self.pending) > 1:
+                self.size -= len(self.pending.popleft())
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def pump(self):
+        "Called by the event loop every LOG_FRAME_MS."
+        with self.lock:
+            text = "".join(self.pending)
+            self.pending.clear()
+            self.size = 0
+        if not text:
+            return
+        widget = self.element.Widget
+        widget.insert("end", text)
+        lines = int(widget.index("end-1c").split(".")[0])
+        if lines > self.max_lines:
+            widget.delete("1.0", f"{lines - self.max_lines + 1}.0")
+        widget.see("end")
+
+
+class Timeline:
+    "Wall time of each build stage, the nuitka stages are detected from its output."
+
+    def __init__(self):
+        self.start_time = time.time()
+        self.stages: list = []
+        self.rest = ""
+
+    def start(self, stage: str):
+        self.end()
+        self.stages.append({"stage": stage, "start": time.time(), "seconds": None})
+
+    def add(self, stage: str, start: float, seconds: float):
+        "A stage which ran next to the others, like pip during nuitka."
+        index = len([i for i in self.stages if i["start"] <= start])
+        if self.stages and self.stages[-1]["seconds"] is None:
+            # the running stage stays the last one
+            index = min(index, len(self.stages) - 1)
+        self.stages.insert(index, {"stage": stage, "start": start, "seconds": seconds})
+
+    def end(self):
+        if self.stages and self.stages[-1]["seconds"] is None:
+            self.stages[-1]["seconds"] = time.time() - self.stages[-1]["start"]
+
+    def feed(self, text: str):
+        lines = (self.rest + text).splitlines(True)
+        self.rest = lines.pop() if lines and not lines[-1].endswith("\n") else ""
+        for line in lines:
+            for marker, stage in NUITKA_STAGES:
+                if marker in line:
+                    self.start(stage)
+                    break
+
+    def summary(self):
+        total = time.time() - self.start_time
+        lines = []
+        for item in self.stages:
+            seconds = item["seconds"] or 0
+            percent = seconds * 100 / total if total else 0
+            lines.append(f"{item['stage']:<16}{seconds:>10.1f}s{percent:>6.1f}%")
+        lines.append(f"{'total':<16}{total:>10.1f}s")
+        return "\n".join(lines) + "\n"
+
+    def save(self, path: Path, **meta):
+        "Write path.json and path.csv, the start of each stage is relative to the build."
+        self.end()
+        stages = [
+            {
+                "stage": i["stage"],
+                "start": round(i["start"] - self.start_time, 3),
+                "seconds": round(i["seconds"] or 0, 3),
+            }
+            for i in self.stages
+        ]
+        data = dict(
+            meta,
+            start=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.start_time)),
+            total=round(time.time() - self.start_time, 3),
+            stages=stages,
+        )
+        path.with_name(f"{path.name}.json").write_text(json.dumps(data, indent=2))
+        csv_path = path.with_name(f"{path.name}.csv")
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, ["stage", "start", "seconds"])
+            writer.writeheader()
+            writer.writerows(stages)
+
+
+def mem_available():
+    "MemAvailable bytes from /proc/meminfo, 0 if unknown."
+    try:
+        with open("/proc/meminfo", "rb") as f:
+            for line in f:
+                if line.startswith(b"MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+
+def _read_proc_stats():
+    "{pid: (ppid, cpu_ticks, rss_bytes)} of all the processes, from /proc/*/stat."
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    stats = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat", "rb") as f:
+                data = f.read()
+            # the comm field may contain spaces and ")"
+            parts = data[data.rindex(b")") + 2 :].split()
+            # utime stime cutime cstime, reaped children are counted by the parent
+            ticks = sum(int(i) for i in parts[11:15])
+            stats[int(name)] = (int(parts[1]), ticks, int(parts[21]) * page_size)
+        except (OSError, ValueError, IndexError):
+            continue
+    return stats
+
+
+def _proc_tree(pid: int, stats: dict):
+    children = collections.defaultdict(list)
+    for _pid, (ppid, _, _) in stats.items():
+        children[ppid].append(_pid)
+    tree = []
+    todo = [pid]
+    while todo:
+        pid = todo.pop()
+        if pid in stats:
+            tree.append(pid)
+            todo.extend(children[pid])
+    return tree
+
+
+class ResourceMonitor(threading.Thread):
+    "Sample the CPU and RSS of the running process tree from /proc, by build stage."
+
+    def __init__(self, job: "BuildJob", interval: float = 0.5):
+        super().__init__(daemon=True)
+        self.job = job
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.stages: dict = {}
+
+    def run(self):
+        if not IS_LINUX:
+            return
+        clock_ticks = os.sysconf("SC_CLK_TCK")
+        last_ticks: dict = {}
+        last_time = time.monotonic()
+        while not self.stopped.wait(self.interval):
+            procs = list(self.job.procs)
+            timeline = self.job.timeline.stages
+            if not procs or not timeline:
+                last_ticks = {}
+                continue
+            stats = _read_proc_stats()
+            # pip and nuitka may run at the same time
+            tree = [pid for proc in procs for pid in _proc_tree(proc.pid, stats)]
+            if not tree:
+                last_ticks = {}
+                continue
+            ticks = {pid: stats[pid][1] for pid in tree}
+            now = time.monotonic()
+            cpu = sum(t - last_ticks.get(pid, 0) for pid, t in ticks.items())
+            # an exited child is added to the cutime of its parent, count it once
+            cpu -= sum(t for pid, t in last_ticks.items() if pid not in ticks)
+            item = self.stages.setdefault(
+                timeline[-1]["stage"],
+                {"samples": 0, "rss_peak": 0, "rss_sum": 0, "cpu": 0.0, "wall": 0.0},
+            )
+            rss = sum(stats[pid][2] for pid in tree)
+            item["samples"] += 1
+            item["rss_peak"] = max(item["rss_peak"], rss)
+            item["rss_sum"] += rss
+            if last_ticks:
+                item["cpu"] += max(cpu, 0) / clock_ticks
+                item["wall"] += now - last_time
+            last_ticks, last_time = ticks, now
+
+    def stop(self):
+        self.stopped.set()
+        if self.is_alive():
+            self.join()
+
+    def report(self):
+        "{stage: {rss_peak, rss_avg, cores}}, cores is the average CPU usage."
+        return {
+            stage: {
+                "rss_peak": item["rss_peak"],
+                "rss_avg": item["rss_sum"] // item["samples"],
+                "cores": round(item["cpu"] / item["wall"], 2) if item["wall"] else 0,
+            }
+            for stage, item in self.stages.items()
+        }
+
+
+def _read_resource_history():
+    try:
+        return json.loads(resource_history_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_resource_history(key: str, jobs: int, report: dict):
+    peak = max(
+        (
+            report[stage]["rss_peak"]
+            for stage in ["c_compile", "c_link"]
+            if stage in report
+        ),
+        default=0,
+    )
+    if not peak:
+        return
+    history = _read_resource_history()
+    history[key] = {"jobs": jobs, "rss_peak": peak, "per_job_rss": peak // jobs}
+    resource_history_path.parent.mkdir(parents=True, exist_ok=True)
+    # every parallel build writes it when finished, in the same process
+    tmp = resource_history_path.with_suffix(
+        f".{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    tmp.write_text(json.dumps(history, indent=2), encoding="utf-8")
+    os.replace(tmp, resource_history_path)
+
+
+def suggest_jobs(key: str, available: int = 0):
+    "The largest --jobs whose C compile fits in the available memory, 0 if unknown."
+    item = _read_resource_history().get(key)
+    available = available or mem_available()
+    if not item or not available:
+        return 0
+    # keep 10% for the page cache and the linker spikes
+    jobs = int(available * 0.9 // max(item["per_job_rss"], 1))
+    return max(1, min(os.cpu_count() or 1, jobs))
+
+
+def size_kind(rel: str, binaries=()):
+    name = rel.rsplit("/", 1)[-1].lower()
+    if (
+        name.endswith((".dll", ".dylib"))
+        or re.search(r"\.so\.\d", name)
+        or (name.startswith("lib") and name.endswith(".so"))
+    ):
+        return "dll"
+    elif name.endswith((".pyd", ".so")):
+        return "extension"
+    elif name.endswith((".py", ".pyc")):
+        return "python"
+    elif name.endswith(".exe") or rel in binaries:
+        return "executable"
+    return "data"
+
+
+def find_binaries(root: Path):
+    "Names of the programs at the top of a .dist (or the onefile binary), by magic."
+    paths = [root] if root.is_file() else [i for i in root.iterdir() if i.is_file()]
+    names = set()
+    for path in paths:
+        # the dlls & extensions next to them have the same magic
+        if path.is_symlink() or size_kind(path.name) in {"dll", "extension"}:
+            continue
+        try:
+            with open(path, "rb") as f:
+                head = f.read(4)
+        except OSError:
+            continue
+        if head.startswith(EXECUTABLE_MAGIC):
+            names.add(path.name)
+    return names
+
+
+def size_manifest(root: Path):
+    "{relative path: size} of the files under root, or root itself."
+    if root.is_file():
+        return {root.name: root.stat().st_size}
+    files = {}
+    for path in root.rglob("*"):
+        # a symlinked launcher takes no space
+        if path.is_file() and not path.is_symlink():
+            files[path.relative_to(root).as_posix()] = path.stat().st_size
+    return files
+
+
+def read_manifest(path: Path):
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))["files"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def size_groups(files: dict, binaries=()):
+    "{kind:group: bytes}, group is the top-level package (dir) of the file."
+    groups: collections.Counter = collections.Counter()
+    for rel, size in files.items():
+        group = rel.split("/", 1)[0] if "/" in rel else "(root)"
+        groups[f"{size_kind(rel, binaries)}:{group}"] += size
+    return groups
+
+
+def size_report(files: dict, limit: int = 15, binaries=()):
+    total = sum(files.values())
+    kinds: collections.Counter = collections.Counter()
+    for rel, size in files.items():
+        kinds[size_kind(rel, binaries)] += size
+    lines = [f"{'total':<40}{total / 1024**2:>10.1f} MB {len(files):>8} files"]
+    for kind, size in kinds.most_common():
+        lines.append(f"  {kind:<38}{size / 1024**2:>10.1f} MB")
+    for group, size in size_groups(files, binaries).most_common(limit):
+        lines.append(f"  {group:<38}{size / 1024**2:>10.1f} MB")
+    return "\n".join(lines) + "\n"
+
+
+def size_diff(old: dict, new: dict, limit: int = 15, binaries=()):
+    old_groups = size_groups(old, binaries)
+    new_groups = size_groups(new, binaries)
+    deltas = [
+        (new_groups[group] - old_groups[group], group)
+        for group in set(old_groups) | set(new_groups)
+        if new_groups[group] != old_groups[group]
+    ]
+    delta = sum(new.values()) - sum(old.values())
+    added = set(new) - set(old)
+    removed = set(old) - set(new)
+    lines = [
+        f"{'diff':<40}{delta / 1024**2:>+10.1f} MB "
+        f"(+{len(added)} / -{len(removed)} files)"
+    ]
+    for size, group in sorted(deltas, key=lambda i: -abs(i[0]))[:limit]:
+        lines.append(f"  {group:<38}{size / 1024**2:>+10.2f} MB")
+    return "\n".join(lines) + "\n"
+
+
+def cli_size(argv: list):
+    parser = argparse.ArgumentParser(
+        prog="nuitka_simple_gui size",
+        description="Size of a .dist (or onefile) by kind and top-level package.",
+    )
+    parser.add_argument("path", help="the .dist dir or the onefile binary")
+    parser.add_argument("manifest", nargs="?", help="a .manifest.json to diff with")
+    args = parser.parse_args(argv)
+    files = size_manifest(Path(args.path))
+    binaries = find_binaries(Path(args.path))
+    print(size_report(files, binaries=binaries), end="", flush=True)
+    if args.manifest:
+        old = read_manifest(Path(args.manifest)) or {}
+        print(size_diff(old, files, binaries=binaries), end="", flush=True)
+    return 0
+
+
+def percentiles(values: list):
+    values = sorted(values)
+    if not values:
+        return {}
+    return {
+        "min": round(values[0], 4),
+        "p50": round(values[len(values) // 2], 4),
+        "p90": round(values[min(len(values) - 1, int(len(values) * 0.9))], 4),
+        "max": round(values[-1], 4),
+    }
+
+
+def _sandbox_env(sandbox: Path):
+    "Environment with the temp, home and cache dirs inside sandbox."
+    env = dict(os.environ)
+    for key, name in [
+        ("TMPDIR", "tmp"),
+        ("TEMP", "tmp"),
+        ("TMP", "tmp"),
+        ("HOME", "home"),
+        ("XDG_CACHE_HOME", "cache"),
+        ("LOCALAPPDATA", "cache"),
+    ]:
+        env[key] = (sandbox / name).as_posix()
+        (sandbox / name).mkdir(parents=True, exist_ok=True)
+    return env
+
+
+def _run_startup(cmd: list, sandbox: Path, timeout: float):
+    "Run the binary once with cwd, temp, home and cache dirs inside sandbox."
+    env = _sandbox_env(sandbox)
+    try:
+        import resource
+
+        blocks = resource.getrusage(resource.RUSAGE_CHILDREN).ru_oublock
+    except ImportError:
+        resource = None
+    result = {"ready": None, "exit": None, "written": None}
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        cmd,
+        cwd=sandbox,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        **POPEN_GROUP,
+    )
+
+    def _read():
+        if proc.stdout.read(1):
+            result["ready"] = time.perf_counter() - start
+        proc.stdout.read()
+
+    reader = threading.Thread(target=_read, daemon=True)
+    reader.start()
+    try:
+        proc.wait(timeout)
+        result["exit"] = time.perf_counter() - start
+    except subprocess.TimeoutExpired:
+        # a GUI or a server: only the time to the first output counts
+        kill_proc_tree(proc)
+        proc.wait()
+    reader.join(1)
+    if resource:
+        blocks = resource.getrusage(resource.RUSAGE_CHILDREN).ru_oublock - blocks
+        result["written"] = blocks * 512
+    result["code"] = proc.returncode
+    return result
+
+
+def startup_bench(
+    cmd: list, sandbox: Path, runs: int = 5, timeout: float = STARTUP_TIMEOUT
+):
+    "{cold: stats, warm: stats} of a onefile binary, cold runs start from an empty sandbox."
+    report = {}
+    try:
+        for phase in ["cold", "warm"]:
+            items = []
+            if phase == "warm":
+                # the first run fills the extraction dir
+                _run_startup(cmd, sandbox, timeout)
+            for _ in range(runs):
+                if phase == "cold":
+                    shutil.rmtree(sandbox, ignore_errors=True)
+                    sandbox.mkdir(parents=True)
+                item = _run_startup(cmd, sandbox, timeout)
+                item["kept"] = get_dir_size(sandbox)
+                items.append(item)
+            written = [i["written"] for i in items if i["written"] is not None]
+            report[phase] = {
+                "exit": percentiles([i["exit"] for i in items if i["exit"]]),
+                "ready": percentiles([i["ready"] for i in items if i["ready"]]),
+                "written": sum(written) // len(written) if written else None,
+                "kept": max(i["kept"] for i in items),
+                "codes": sorted({i["code"] for i in items}),
+            }
+    finally:
+        shutil.rmtree(sandbox, ignore_errors=True)
+    return report
+
+
+def startup_report(report: dict):
+    lines = [
+        f"{'mode':<10}{'phase':<6}{'exit p50':>10}{'p90':>9}{'max':>9}"
+        f"{'ready p50':>11}{'written':>10}{'kept':>10}"
+    ]
+    for mode, item in report.items():
+        for phase in ["cold", "warm"]:
+            stats = item.get(phase)
+            if not stats:
+                continue
+            _exit, ready = stats["exit"], stats["ready"]
+            written = stats["written"]
+            lines.append(
+                f"{mode:<10}{phase:<6}"
+                f"{_exit.get('p50', 0):>9.3f}s{_exit.get('p90', 0):>8.3f}s"
+                f"{_exit.get('max', 0):>8.3f}s{ready.get('p50', 0):>10.3f}s"
+                f"{'-' if written is None else f'{written / 1024**2:.1f} MB':>10}"
+                f"{stats['kept'] / 1024**2:>7.1f} MB"
+            )
+    return "\n".join(lines) + "\n"
+
+
+def parse_importtime(text: str):
+    "The import tree of PYTHONPROFILEIMPORTTIME output: [{module, self, cum, children}]."
+    stack: list = []
+    for line in text.splitlines():
+        match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)", line)
+        if not match:
+            continue
+        _self, cum, indent, module = match.groups()
+        depth = (len(indent) - 1) // 2
+        node = {
+            "module": module,
+            "self": int(_self),
+            "cum": int(cum),
+            "depth": depth,
+            "children": [],
+        }
+        # children are printed before their parent, one level deeper
+        while stack and stack[-1]["depth"] > depth:
+            node["children"].insert(0, stack.pop())
+        stack.append(node)
+    return stack
+
+
+def profile_imports(cmd: list, sandbox: Path, timeout: float = STARTUP_TIMEOUT):
+    "Run the binary once with PYTHONPROFILEIMPORTTIME=1, return the import tree."
+    env = _sandbox_env(sandbox)
+    env["PYTHONPROFILEIMPORTTIME"] = "1"
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=sandbox,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            **POPEN_GROUP,
+        )
+        chunks: list = []
+        reader = threading.Thread(
+            target=lambda: chunks.append(proc.stderr.read()), daemon=True
+        )
+        reader.start()
+        try:
+            proc.wait(timeout)
+        except subprocess.TimeoutExpired:
+            kill_proc_tree(proc)
+            proc.wait()
+        reader.join(5)
+    finally:
+        shutil.rmtree(sandbox, ignore_errors=True)
+    return parse_importtime(b"".join(chunks).decode("utf-8", "replace"))
+
+
+def import_advice(roots: list, values: dict, graph: typing.Optional[dict] = None):
+    "[(module, cumulative us, advice)] for the slow imports, by the config choices."
+    includes = set(
+        (values.get("--include-package") or "").split()
+        + (values.get("--include-module") or "").split()
+    )
+    plugins = {
+        k[len("_plugin_") :]: v
+        for k, v in values.items()
+        if str(k).startswith("_plugin_")
+    }
+    used = set()
+    if graph:
+        used = {i.split(".")[0] for i in graph["external"]} | {
+            _module_name(graph["root"], path).split(".")[0] for path in graph["edges"]
+        }
+    advice = []
+
+    def _walk(node, top_level):
+        if node["cum"] < IMPORT_SLOW_US:
+            return
+        module = node["module"]
+        name = module.split(".")[0]
+        reasons = []
+        if any(i == module or module.startswith(f"{i}.") for i in includes):
+            reasons.append("forced by --include-*, drop it if it is optional")
+        for plugin, enabled in plugins.items():
+            if enabled and PLUGIN_PACKAGES.get(plugin, plugin) == name:
+                reasons.append(f"pulled in by the {plugin} plugin")
+        if top_level and name in used:
+            reasons.append("imported at startup, import it lazily where it is used")
+        elif top_level and graph and not _is_stdlib(name) and name not in includes:
+            reasons.append(
+                f"not imported by the sources, try --nofollow-import-to={name}"
+            )
+        if reasons:
+            advice.append((module, node["cum"], "; ".join(reasons)))
+            return
+        for child in node["children"]:
+            _walk(child, False)
+
+    for root in roots:
+        _walk(root, True)
+    return sorted(advice, key=lambda i: -i[1])
+
+
+def import_report(roots: list, advice: list, limit: int = 30):
+    total = sum(i["cum"] for i in roots)
+    lines = [f"{'total':<50}{total / 1000:>10.1f} ms"]
+    nodes = [(0, i) for i in sorted(roots, key=lambda i: -i["cum"])]
+    while nodes and len(lines) <= limit:
+        depth, node = nodes.pop(0)
+        if node["cum"] * 100 < total:
+            continue
+        name = f"{'  ' * depth}{node['module']}"
+        lines.append(f"{name:<50}{node['cum'] / 1000:>10.1f} ms")
+        children = sorted(node["children"], key=lambda i: -i["cum"])
+        nodes[:0] = [(depth + 1, i) for i in children]
+    for module, cum, reason in advice:
+        lines.append(f"[{cum / 1000:.1f} ms] {module}: {reason}")
+    return "\n".join(lines) + "\n"
+
+
+def cli_profile(argv: list):
+    parser = argparse.ArgumentParser(
+        prog="nuitka_simple_gui profile",
+        description="Import time tree of a built binary, with advice from a config.json.",
+    )
+    parser.add_argument("binary", help="the onefile binary or the program in .dist")
+    parser.add_argument("config", nargs="?", help="the config.json it was built from")
+    args = parser.parse_args(argv)
+    binary = Path(args.binary).absolute()
+    values, graph = {}, None
+    if args.config:
+        values = json.loads(Path(args.config).read_text(encoding="utf-8"))
+        if values.get("file_path"):
+            graph = scan_import_graph(Path(values["file_path"]))
+    # next to the .dist, a new dir inside changes its mtime and breaks the reuse
+    parent = binary.parent.parent if binary.parent.suffix == ".dist" else binary.parent
+    roots = profile_imports([binary.as_posix()], parent / f"{binary.stem}.profile")
+    print(import_report(roots, import_advice(roots, values, graph)), end="")
+    return 0
+
+
+def _hash_file(path: Path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024**2), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _store_manifests(store: Path, name: str = ""):
+    "The manifests in the store, oldest first."
+    manifests = []
+    for path in (store / "builds").glob(f"{name or '*'}/*.json"):
+        try:
+            manifests.append(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            continue
+    return sorted(manifests, key=lambda i: (i["created"], i["id"]))
+
+
+def _store_manifest_path(store: Path, build_id: str):
+    for path in (store / "builds").glob(f"*/{build_id}.json"):
+        return path
+    raise FileNotFoundError(f"build {build_id} not in {store}")
+
+
+def store_add(src: Path, name: str, store: Path = artifact_store_path, **meta):
+    "Save a .dist (or a file) as a manifest of content hashes, and the new blobs."
+    root = src if src.is_dir() else src.parent
+    items = sorted(src.rglob("*")) if src.is_dir() else [src]
+    paths = [i for i in items if i.is_file() and not i.is_symlink()]
+    with ThreadPoolExecutor() as pool:
+        digests = list(pool.map(_hash_file, paths))
+    files: dict = {}
+    added = 0
+    for path, digest in zip(paths, digests):
+        stat = path.stat()
+        executable = bool(stat.st_mode & 0o111)
+        # the blobs are hardlinked on checkout, so the mode is part of the key
+        key = f"{digest}x" if executable else digest
+        blob = store / "blobs" / key[:2] / key
+        if not blob.is_file():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            tmp = blob.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+            shutil.copyfile(path, tmp)
+            if not IS_WIN32:
+                os.chmod(tmp, 0o555 if executable else 0o444)
+            os.replace(tmp, blob)
+            added += stat.st_size
+        files[path.relative_to(root).as_posix()] = [key, stat.st_size]
+    content = json.dumps(files, sort_keys=True).encode("utf-8")
+    build_id = (
+        f"{time.strftime('%Y%m%d-%H%M%S')}-{hashlib.sha256(content).hexdigest()[:8]}"
+    )
+    manifest = dict(
+        meta,
+        id=build_id,
+        name=name,
+        time=time.strftime("%Y-%m-%d %H:%M:%S"),
+        created=time.time(),
+        source=src.absolute().as_posix(),
+        size=sum(size for _, size in files.values()),
+        files=files,
+        dirs=[i.relative_to(root).as_posix() for i in items if i.is_dir()],
+        links={
+            i.relative_to(root).as_posix(): os.readlink(i)
+            for i in items
+            if i.is_symlink()
+        },
+    )
+    builds = store / "builds" / name
+    builds.mkdir(parents=True, exist_ok=True)
+    for index in itertools.count(1):
+        try:
+            with open(builds / f"{manifest['id']}.json", "x", encoding="utf-8") as f:
+                f.write(json.dumps(manifest))
+            break
+        except FileExistsError:
+            # the same files stored twice in one second
+            manifest["id"] = f"{build_id}-{index}"
+    return manifest, added
+
+
+def store_checkout(build_id: str, target: Path, store: Path = artifact_store_path):
+    "Rebuild a stored .dist in target by hardlinks, copies across file systems."
+    manifest = json.loads(_store_manifest_path(store, build_id).read_text("utf-8"))
+    if target.exists() and any(target.iterdir()):
+        raise FileExistsError(f"{target} is not empty")
+    target.mkdir(parents=True, exist_ok=True)
+    for rel in manifest["dirs"]:
+        (target / rel).mkdir(parents=True, exist_ok=True)
+    copied = 0
+    for rel, (key, size) in manifest["files"].items():
+        blob = store / "blobs" / key[:2] / key
+        path = target / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(blob, path)
+        except OSError:
+            shutil.copy2(blob, path)
+            copied += size
+    for rel, link in manifest["links"].items():
+        os.symlink(link, target / rel)
+    return manifest, copied
+
+
+def store_gc(store: Path = artifact_store_path, keep: int = 0, remove: list = ()):
+    "Drop the builds in remove and all but the last keep by name, then unused blobs."
+    by_name: dict = collections.defaultdict(list)
+    for manifest in _store_manifests(store):
+        by_name[manifest["name"]].append(manifest)
+    used = set()
+    for name, manifests in by_name.items():
+        for index, manifest in enumerate(manifests):
+            old = keep and index < len(manifests) - keep
+            if old or manifest["id"] in remove:
+                _store_manifest_path(store, manifest["id"]).unlink()
+            else:
+                used.update(key for key, _ in manifest["files"].values())
+    freed = 0
+    for blob in (store / "blobs").glob("*/*"):
+        # a blob being copied by store_add, unless left by a crash long ago
+        if blob.suffix == ".tmp" and time.time() - blob.stat().st_mtime < 3600:
+            continue
+        if blob.name not in used:
+            freed += blob.stat().st_size
+            if IS_WIN32:
+                os.chmod(blob, 0o666)
+            blob.unlink()
+    return freed
+
+
+def store_report(store: Path = artifact_store_path, name: str = ""):
+    manifests = _store_manifests(store, name)
+    lines = []
+    for manifest in manifests:
+        lines.append(
+            f"{manifest['id']:<30}{manifest['name']:<20}"
+            f"{manifest['size'] / 1024**2:>10.1f} MB {len(manifest['files']):>8} files"
+        )
+    logical = sum(i["size"] for i in manifests)
+    stored = sum(i.stat().st_size for i in (store / "blobs").glob("*/*"))
+    lines.append(
+        f"{len(manifests)} builds, {logical / 1024**2:.1f} MB in {stored / 1024**2:.1f} MB of blobs"
+    )
+    return "\n".join(lines) + "\n"
+
+
+def cli_store(argv: list):
+    parser = argparse.ArgumentParser(
+        prog="nuitka_simple_gui store",
+        description="Keep the .dist of every release as deduplicated blobs.",
+    )
+    parser.add_argument("--store", default=artifact_store_path.as_posix())
+    commands = parser.add_subparsers(dest="command", required=True)
+    parser_list = commands.add_parser("list", help="the stored builds")
+    parser_list.add_argument("name", nargs="?", default="")
+    parser_add = commands.add_parser("add", help="store a .dist or a onefile binary")
+    parser_add.add_argument("path")
+    parser_add.add_argument("--name", default="", help="default to the path stem")
+    parser_checkout = commands.add_parser("checkout", help="hardlink a build to a dir")
+    parser_checkout.add_argument("id")
+    parser_checkout.add_argument("target")
+    parser_rm = commands.add_parser("rm", help="remove builds and their unused blobs")
+    parser_rm.add_argument("ids", nargs="+")
+    parser_gc = commands.add_parser("gc", help="keep the last builds of each name")
+    parser_gc.add_argument("--keep", type=int, default=10)
+    args = parser.parse_args(argv)
+    store = Path(args.store)
+    if args.command == "list":
+        print(store_report(store, args.name), end="")
+    elif args.command == "add":
+        path = Path(args.path)
+        manifest, added = store_add(path, args.name or path.stem, store)
+        print(f"stored {manifest['id']}, {added / 1024**2:.1f} MB new", flush=True)
+    elif args.command == "checkout":
+        target = Path(args.target)
+        manifest, copied = store_checkout(args.id, target, store)
+        print(
+            f"{manifest['id']} -> {target.as_posix()}, {copied / 1024**2:.1f} MB copied",
+            flush=True,
+        )
+    else:
+        remove = args.ids if args.command == "rm" else ()
+        freed = store_gc(store, getattr(args, "keep", 0), remove)
+        print(f"freed {freed / 1024**2:.1f} MB", flush=True)
+    return 0
+
+
+def upx_settings_key(upx: str, args: list):
+    "Hash of the upx binary and the options, the packed files depend on both."
+    h = hashlib.sha256(_hash_file(Path(upx)).encode("utf-8"))
+    h.update("\0".join(args).encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def upx_file(upx: str, args: list, path: Path, cache_dir: Path):
+    "Pack path in place by the cached result or by upx, return (status, saved bytes)."
+    digest = _hash_file(path)
+    packed = cache_dir / digest
+    skip = cache_dir / f"{digest}.skip"
+    size = path.stat().st_size
+    if packed.is_file():
+        shutil.copyfile(packed, path)
+        # the last use for cache_gc
+        os.utime(packed)
+        return "cached", size - packed.stat().st_size
+    elif skip.is_file():
+        return "skipped before", 0
+    tmp = cache_dir / f"{digest}.{threading.get_ident()}.tmp"
+    shutil.copyfile(path, tmp)
+    try:
+        output = subprocess.run(
+            [upx, *args, tmp.as_posix()],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        reason = ""
+        if output.returncode:
+            lines = output.stdout.decode("utf-8", "replace").strip().splitlines()
+            reason = lines[-1] if lines else f"upx returned {output.returncode}"
+        elif tmp.stat().st_size > size * UPX_MAX_RATIO:
+            reason = f"ratio {tmp.stat().st_size / size:.2f} > {UPX_MAX_RATIO}"
+        else:
+            # -t unpacks in memory, close to what every start of the app pays,
+            # minus the start of upx itself
+            start = time.perf_counter()
+            subprocess.run([upx, "-V"], capture_output=True)
+            middle = time.perf_counter()
+            subprocess.run([upx, "-t", "-q", tmp.as_posix()], capture_output=True)
+            end = time.perf_counter()
+            cost = max(end - middle - (middle - start), 0) * 1000
+            if cost > UPX_MAX_UNPACK_MS:
+                reason = f"unpack {cost:.0f} ms > {UPX_MAX_UNPACK_MS} ms"
+        if reason:
+            skip.write_text(reason, encoding="utf-8")
+            return f"skipped: {reason}", 0
+        os.replace(tmp, packed)
+    finally:
+        tmp.unlink(missing_ok=True)
+    shutil.copyfile(packed, path)
+    return "packed", size - packed.stat().st_size
+
+
+def upx_dist(dist: Path, workers: int = 0, log=None, upx: str = ""):
+    "Pack the binaries of a .dist with upx in parallel, reusing the packed results."
+    log = log or print_log
+    upx = upx or shutil.which("upx") or ""
+    if not upx:
+        raise FileNotFoundError("upx not found in PATH")
+    cache_dir = upx_cache_path / upx_settings_key(upx, UPX_ARGS)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    binaries = find_binaries(dist)
+    paths = [
+        path
+        for path in dist.rglob("*")
+        if path.is_file()
+        and not path.is_symlink()
+        and path.stat().st_size >= UPX_MIN_SIZE
+        and size_kind(path.relative_to(dist).as_posix(), binaries)
+        in {"extension", "dll", "executable"}
+        # nuitka's upx plugin leaves it too
+        and not path.name.lower().startswith("vcruntime140")
+    ]
+    counter: collections.Counter = collections.Counter()
+    saved = 0
+    # upx does the work in its own process, threads are enough to run it in parallel
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        futures = {
+            pool.submit(upx_file, upx, UPX_ARGS, path, cache_dir): path
+            for path in paths
+        }
+        for future in futures:
+            status, _saved = future.result()
+            counter[status.split(":")[0]] += 1
+            saved += _saved
+            if status.startswith("skipped:"):
+                log(f"{futures[future].relative_to(dist).as_posix()} {status}\n")
+    log(
+        ", ".join(f"{count} {status}" for status, count in sorted(counter.items()))
+        + f", {saved / 1024**2:.1f} MB saved\n"
+    )
+    return counter, saved
+
+
+class BuildJob:
+    "One pip + nuitka + post-build pipeline, driven by window values or a config.json."
+
+    def __init__(self, values: dict, python_exe: str = "", jobs: int = 0, log=None):
+        self.values = dict(values)
+        self.values.pop("build-system", None)
+        if jobs:
+            self.values["--jobs"] = str(jobs)
+        self.cmd, self.pip_cmd, self.file_path, self.output_path = make_cmd(
+            self.values, python_exe
+        )
+        if str(self.values.get("--jobs")).strip() == "auto":
+            self.set_jobs(suggest_jobs(self.history_key) or os.cpu_count() or 1)
+        self.name = self.file_path.stem
+        self.entries = [self.file_path]
+        if not self.values.get("--module"):
+            self.entries = entry_points(self.values)
+        self.log = log or print_log
+        # upx of a .dist runs after nuitka, in parallel and cached by file
+        self.upx = bool(
+            "--enable-plugin=upx" in self.cmd
+            and self.values.get("--standalone")
+            and not self.values.get("--onefile")
+            and not self.values.get("--module")
+        )
+        if self.upx:
+            self.cmd.remove("--enable-plugin=upx")
+        self.reused = False
+        self.procs: list = []
+        self.stopping = False
+        self.aborted = False
+        self.ok: typing.Optional[bool] = None
+        self.log_file: typing.Optional[LogFile] = None
+        self.timeline = Timeline()
+        self.monitor_report: dict = {}
+        self.startup: dict = {}
+        self.compile_cache: dict = {}
+        self.compile_shared = False
+        self.nuitka_rest = ""
+
+    @classmethod
+    def from_config(cls, path, **kwargs):
+        return cls(json.loads(Path(path).read_text(encoding="utf-8")), **kwargs)
+
+    @property
+    def history_key(self):
+        return self.file_path.absolute().as_posix()
+
+    @property
+    def jobs(self):
+        for arg in self.cmd:
+            if arg.startswith("--jobs="):
+                return int(arg[7:])
+        return os.cpu_count() or 1
+
+    def set_jobs(self, jobs: int):
+        self.values["--jobs"] = str(jobs)
+        self.cmd = [i for i in self.cmd if not i.startswith("--jobs=")]
+        self.cmd.insert(3, f"--jobs={jobs}")
+
+    @property
+    def pips_path(self):
+        return self.output_path / f"{self.name}.pips"
+
+    @property
+    def dist_path(self):
+        return self.output_path / f"{self.name}.dist"
+
+    @property
+    def prebuilt_path(self):
+        return self.output_path / f"{self.name}.prebuilt"
+
+    @property
+    def prebuilt(self):
+        "The pip packages to ship as extension modules instead of sources."
+        if not self.pip_cmd:
+            return []
+        return str(self.values.get("prebuilt") or "").split()
+
+    @property
+    def result_path(self):
+        return self.output_path / f"{self.name}.build.json"
+
+    @property
+    def binary_name(self):
+        "File name nuitka gives the program: --output-filename, or <name>.exe / .bin."
+        name = (self.values.get("--output-filename") or "").strip()
+        name = name.replace('"', "_").replace(" ", "_").replace("'", "_")
+        if IS_WIN32:
+            name = name or self.name
+            return name if name.endswith(".exe") else f"{name}.exe"
+        return name or f"{self.name}.bin"
+
+    @property
+    def artifact_path(self):
+        if self.values.get("--onefile"):
+            return self.output_path / self.binary_name
+        elif self.values.get("--module"):
+            for path in self.output_path.glob(f"{self.name}.*"):
+                if path.suffix in {".pyd", ".so"}:
+                    return path
+            return self.output_path / f"{self.name}.so"
+        return self.dist_path
+
+    @property
+    def exe_path(self):
+        "The program to run: the onefile binary or the executable in the .dist."
+        if self.values.get("--module"):
+            return None
+        elif self.values.get("--onefile"):
+            return self.artifact_path
+        return self.dist_path / self.binary_name
+
+    def fingerprint(self):
+        "Hash of the command, python & nuitka versions and the local sources."
+        python_exe = self.cmd[0]
+        h = hashlib.sha256(python_info(python_exe).encode("utf-8"))
+        h.update(nuitka_version(python_exe).encode("utf-8"))
+        raw_dir = f"--include-raw-dir={self.pips_path.as_posix()}="
+        for arg in self.cmd:
+            if arg.startswith("--jobs="):
+                # the scheduler changes it, but it never changes the output
+                continue
+            elif arg.startswith(raw_dir):
+                # the pip dir may be swapped to the pip cache
+                arg = pip_cache_key(self.pip_cmd[4:-2], python_exe)
+            h.update(arg.encode("utf-8") + b"\0")
+        if self.upx:
+            # the plugin flag left self.cmd, but a reused .dist is packed or not
+            h.update(("upx\0" + "\0".join(UPX_ARGS)).encode("utf-8") + b"\0")
+        for path in sorted(self.local_imports()):
+            h.update(path.as_posix().encode("utf-8") + b"\0")
+            h.update(path.read_bytes())
+        return h.hexdigest()
+
+    def local_imports(self):
+        "The local sources reachable from any of the entry points."
+        paths: set = set()
+        for entry in self.entries:
+            paths |= local_imports(entry.absolute())
+        return paths
+
+    @property
+    def launchers(self):
+        "{entry name: launcher path} of the entry points not named like exe_path."
+        exe = self.exe_path
+        if exe is None or len(self.entries) < 2:
+            return {}
+        suffix = exe.suffix if exe.suffix in {".exe", ".bin"} else ""
+        launchers = {}
+        for entry in self.entries:
+            path = exe.with_name(f"{entry.stem}{suffix}")
+            if path != exe:
+                launchers[entry.stem] = path
+        return launchers
+
+    def make_launchers(self):
+        "Link every entry point name to the multidist binary, which runs by name."
+        exe = self.exe_path
+        launchers = self.launchers
+        if launchers and not exe.is_file():
+            raise FileNotFoundError(f"no binary to launch: {exe.as_posix()}")
+        for name, path in launchers.items():
+            if path.is_symlink() or path.is_file():
+                path.unlink()
+            try:
+                if IS_WIN32:
+                    os.link(exe, path)
+                else:
+                    path.symlink_to(exe.name)
+            except OSError:
+                shutil.copy2(exe, path)
+            self.write(f"launcher {name}: {path.as_posix()}\n")
+
+    def reuse_result(self, fingerprint: str):
+        try:
+            result = json.loads(self.result_path.read_text(encoding="utf-8"))
+            artifact = self.artifact_path
+            return (
+                result["fingerprint"] == fingerprint
+                and result["artifact"] == artifact.as_posix()
+                and result["mtime"] == artifact.stat().st_mtime_ns
+            )
+        except (OSError, ValueError, KeyError):
+            return False
+
+    def save_result(self, fingerprint: str):
+        artifact = self.artifact_path
+        result = {
+            "fingerprint": fingerprint,
+            "artifact": artifact.as_posix(),
+            "mtime": artifact.stat().st_mtime_ns,
+            "cmd": self.cmd,
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        self.result_path.write_text(json.dumps(result, indent=2), encoding="utf-8")
+
+    def write(self, text: str):
+        if not text:
+            return
+        if self.log_file:
+            self.log_file.write(text)
+        self.log(text)
+
+    def sep(self, text: str):
+        self.write(sep_line(text))
+
+    def call(self, cmd: list, shell=False, feed=None, env=None):
+        if self.aborted:
+            raise ValueError("Cancelled")
+        proc = subprocess.Popen(
+            cmd,
+            shell=shell,
+            # creationflags=subprocess.CREATE_NO_WINDOW,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env=env,
+            **POPEN_GROUP,
+        )
+        self.procs.append(proc)
+        try:
+            decoder = codecs.getincrementaldecoder("utf-8")("replace")
+            while not self.aborted:
+                chunk = proc.stdout.read1(LOG_CHUNK_SIZE)
+                if not chunk:
+                    break
+                text = decoder.decode(chunk)
+                self.write(text)
+                if feed:
+                    feed(text)
+            if self.aborted:
+                kill_proc_tree(proc)
+            self.write(decoder.decode(b"", final=True))
+            code = proc.wait()
+        finally:
+            self.procs.remove(proc)
+        if self.aborted:
+            raise ValueError("Cancelled")
+        elif code != 0:
+            raise ValueError("Bad return code: %s" % code)
+
+    def abort(self):
+        "Kill the running commands, and refuse to start new ones."
+        self.aborted = True
+        survivors = []
+        for proc in list(self.procs):
+            survivors.extend(kill_proc_tree(proc))
+        return survivors
+
+    def stop(self):
+        self.stopping = True
+        if not self.procs:
+            self.aborted = True
+            return
+        survivors = self.abort()
+        if survivors:
+            self.write(f"still alive after cancel: {survivors}\n")
+        else:
+            self.write("cancelled, no process left\n")
+
+    def run_pip(self):
+        "pip install -t, or take it from the pip cache, return the target dir."
+        self.sep('"pip install" Start')
+        pip_args = self.pip_cmd[4:-2]
+        self.write(f"{pip_args}\n")
+        key = ""
+        if self.values.get("pip_cache", True):
+            key = pip_cache_key(pip_args, self.pip_cmd[0])
+            cached = pip_cache_get(key)
+            if cached:
+                self.write(f"pip cache hit: {cached.as_posix()}\n")
+                self.sep('"pip install" Cached')
+                return cached
+        self.call(self.pip_cmd)
+        path = self.pips_path
+        if key:
+            path = pip_cache_put(key, self.pips_path, pip_args)
+        self.sep('"pip install" Finished')
+        return path
+
+    def can_overlap_pip(self):
+        "Only a .dist can take the pip dir after nuitka, a onefile payload is sealed."
+        return bool(
+            self.pip_cmd
+            and self.values.get("pip_overlap", True)
+            and self.values.get("--standalone")
+            and not self.values.get("--onefile")
+            and not self.values.get("--module")
+            # the packages are compiled from the pip dir before nuitka
+            and not self.prebuilt
+            and not (
+                self.values.get("pip_cache", True)
+                and pip_cache_get(pip_cache_key(self.pip_cmd[4:-2], self.pip_cmd[0]))
+            )
+        )
+
+    def run_pip_nuitka(self):
+        "pip install during nuitka, then copy the pip dir into the .dist."
+        raw_dir = f"--include-raw-dir={self.pips_path.as_posix()}=./"
+        self.cmd = [i for i in self.cmd if i != raw_dir]
+        result: dict = {}
+        start = time.time()
+
+        def _pip():
+            try:
+                result["path"] = self.run_pip()
+            except Exception as error:
+                if not self.aborted:
+                    # a failed pip makes the build useless
+                    result["error"] = error
+                    self.abort()
+            finally:
+                self.timeline.add("pip", start, time.time() - start)
+
+        thread = threading.Thread(target=_pip, daemon=True)
+        thread.start()
+        try:
+            self.run_nuitka()
+        except Exception:
+            self.abort()
+            thread.join()
+            # nuitka was cancelled by the failed pip, show the pip error
+            if "error" in result:
+                raise result["error"] from None
+            raise
+        thread.join()
+        if "error" in result:
+            raise result["error"]
+        elif "path" not in result:
+            raise ValueError("Cancelled")
+        self.sep("Merge pip dir")
+        self.timeline.start("merge")
+        shutil.copytree(result["path"], self.dist_path, dirs_exist_ok=True)
+        self.timeline.end()
+
+    def run_prebuilt(self, pip_dir: Path):
+        "Compile the chosen pip packages with --module once, stage the cached ones."
+        self.sep("Prebuilt Start")
+        self.timeline.start("prebuilt")
+        python_exe = self.cmd[0]
+        shutil.rmtree(self.prebuilt_path, ignore_errors=True)
+        self.prebuilt_path.mkdir(parents=True)
+        for name in self.prebuilt:
+            source = pip_dir / name
+            if not source.is_dir():
+                source = pip_dir / f"{name}.py"
+            if not source.is_file() and not source.is_dir():
+                raise FileNotFoundError(f"{name} not found in {pip_dir.as_posix()}")
+            version = package_version(pip_dir, name) or "0"
+            cache_dir = prebuilt_cache_path / prebuilt_key(name, version, python_exe)
+            status = "cached"
+            if not cache_dir.is_dir():
+                # private to this build, parallel ones may compile the same key
+                prebuilt_cache_path.mkdir(parents=True, exist_ok=True)
+                tmp = Path(tempfile.mkdtemp(suffix=".tmp", dir=prebuilt_cache_path))
+                cmd = [
+                    python_exe,
+                    "-m",
+                    "nuitka",
+                    "--module",
+                    source.as_posix(),
+                    f"--output-dir={tmp.as_posix()}",
+                    f"--jobs={self.jobs}",
+                    "--remove-output",
+                    "--no-pyi-file",
+                ]
+                if source.is_dir():
+                    cmd.append(f"--include-package={name}")
+                cmd.extend(
+                    i
+                    for i in self.cmd
+                    if i in {"--assume-yes-for-downloads", "--mingw64", "--clang"}
+                )
+                try:
+                    self.call(cmd, shell=IS_WIN32, env=self.compiler_cache_env())
+                    try:
+                        tmp.rename(cache_dir)
+                    except OSError:
+                        # another build stored it first
+                        if not cache_dir.is_dir():
+                            raise
+                finally:
+                    shutil.rmtree(tmp, ignore_errors=True)
+                status = "compiled"
+            for path in cache_dir.iterdir():
+                shutil.copy2(path, self.prebuilt_path / path.name)
+                # the last use for cache_gc
+                os.utime(path)
+            self.write(f"prebuilt {name} {version}: {status}\n")
+        self.sep("Prebuilt Finished")
+
+    def use_pips(self, path: Path):
+        "Point --include-raw-dir at another pip target dir."
+        old = f"--include-raw-dir={self.pips_path.as_posix()}=./"
+        self.cmd = [
+            f"--include-raw-dir={path.as_posix()}=./" if i == old else i
+            for i in self.cmd
+        ]
+
+    def run_nuitka(self):
+        self.sep("Build Start")
+        self.timeline.start("nuitka")
+        cache_size = compiler_cache_size()
+        COMPILING.append(self)
+        if len(COMPILING) > 1:
+            # the cache growth of concurrent builds can't be told apart
+            for job in COMPILING:
+                job.compile_shared = True
+        try:
+            # shell=True only works with a list of args on Windows
+            self.call(
+                self.cmd,
+                shell=IS_WIN32,
+                feed=self.feed_nuitka,
+                env=self.compiler_cache_env(),
+            )
+        finally:
+            COMPILING.remove(self)
+        self.timeline.end()
+        self.sep("Build Success")
+        size = compiler_cache_size()
+        grown = None
+        if cache_size is not None and size is not None:
+            grown = size - cache_size
+        self.report_compiler_cache(grown)
+
+    def feed_nuitka(self, text: str):
+        self.timeline.feed(text)
+        lines = (self.nuitka_rest + text).splitlines(True)
+        self.nuitka_rest = lines.pop() if lines and not lines[-1].endswith("\n") else ""
+        for line in lines:
+            match = CCACHE_RESULT.search(line)
+            if match:
+                result, count = match.group(1), int(match.group(2))
+                key = {"cache hit": "hits", "cache miss": "misses"}.get(result, "other")
+                self.compile_cache.setdefault("tool", "ccache")
+                self.compile_cache[key] = self.compile_cache.get(key, 0) + count
+                continue
+            match = CLCACHE_RESULT.search(line)
+            if match:
+                self.compile_cache.update(
+                    tool="clcache",
+                    hits=int(match.group(1)),
+                    misses=int(match.group(2)),
+                )
+
+    def compiler_cache_env(self):
+        "The environment of nuitka: a ccache found outside PATH, the managed cache dir."
+        if IS_WIN32:
+            # nuitka downloads ccache for mingw64, and clcache is built in for MSVC
+            return None
+        path = find_ccache()
+        if not path:
+            self.write(
+                "ccache not found, all the C files are compiled on every build: "
+                "install ccache (apt / dnf / brew install ccache) "
+                "or set NUITKA_CCACHE_BINARY\n"
+            )
+            return None
+        env = dict(os.environ, NUITKA_CCACHE_BINARY=path)
+        # without CCACHE_DIR nuitka keeps the objects in <cache dir>/ccache/<abi>
+        env.pop("CCACHE_DIR", None)
+        return env
+
+    def compile_key(self):
+        "What a cached C object depends on, besides the generated C code."
+        python_exe = self.cmd[0]
+        probe = probe_python(python_exe)
+        ccache = probe.get("tools", {}).get("ccache", {})
+        return {
+            "python": python_info(python_exe).splitlines()[0],
+            "nuitka": nuitka_version(python_exe),
+            "compiler": probe.get("c_compiler", ""),
+            "ccache": ccache.get("version", ""),
+            "flags": " ".join(i for i in self.cmd if i.startswith(C_FLAG_PREFIXES)),
+        }
+
+    def report_compiler_cache(self, grown: typing.Optional[int]):
+        stats = self.compile_cache
+        if not stats:
+            return
+        stats["grown"] = grown
+        hits, misses = stats.get("hits", 0), stats.get("misses", 0)
+        self.sep("Compiler Cache")
+        rate = hits / (hits + misses) if hits + misses else 0
+        growth = "cache growth unknown"
+        if grown is not None:
+            growth = f"cache grew {grown / 1024**2:.1f} MB"
+            if self.compile_shared:
+                growth += " (with the concurrent builds)"
+        self.write(
+            f"{stats['tool']}: {hits} hits, {misses} misses ({rate:.0%} hit rate), "
+            f"{stats.get('other', 0)} uncacheable, {growth}\n"
+        )
+        try:
+            key = self.compile_key()
+        except (OSError, subprocess.SubprocessError):
+            return
+        history = _read_compile_history()
+        last = history.get(self.history_key)
+        if last and misses and not hits:
+            changed = [k for k in key if key[k] != last["key"].get(k)]
+            for k in changed:
+                self.write(
+                    f"recompiled all, {k} changed: {last['key'].get(k)!r} -> {key[k]!r}\n"
+                )
+            if not changed:
+                self.write(
+                    "recompiled all with the same compiler and flags: "
+                    "the generated C code changed (nuitka options or sources)\n"
+                )
+        history[self.history_key] = {
+            "key": key,
+            "hits": hits,
+            "misses": misses,
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        compile_history_path.parent.mkdir(parents=True, exist_ok=True)
+        # parallel builds are threads of one process
+        tmp = compile_history_path.with_suffix(
+            f".{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp.write_text(json.dumps(history, indent=2), encoding="utf-8")
+        os.replace(tmp, compile_history_path)
+
+    def analyze_size(self):
+        "Save <name>.manifest.json, and diff it with the manifest of the last build."
+        target = self.dist_path if self.dist_path.is_dir() else self.artifact_path
+        if not target.exists():
+            return
+        self.timeline.start("size")
+        files = size_manifest(target)
+        path = self.output_path / f"{self.name}.manifest.json"
+        prev_path = self.output_path / f"{self.name}.manifest.prev.json"
+        old = read_manifest(path)
+        if old == files:
+            # unchanged (reused build): keep showing the diff with the build before
+            old = read_manifest(prev_path)
+        else:
+            if old is not None:
+                os.replace(path, prev_path)
+            manifest = {
+                "target": target.as_posix(),
+                "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "total": sum(files.values()),
+                "files": files,
+            }
+            path.write_text(json.dumps(manifest, separators=(",", ":")))
+        self.sep("Size")
+        binaries = find_binaries(target)
+        self.write(size_report(files, binaries=binaries))
+        if old is not None:
+            self.write(size_diff(old, files, binaries=binaries))
+
+    def run_startup(self):
+        "Time the onefile binary, merged into <name>.startup.json by onefile cache mode."
+        runs = int(self.values.get("startup_runs") or 0)
+        artifact = self.artifact_path
+        if not (runs > 0 and self.values.get("--onefile") and artifact.is_file()):
+            return
+        self.sep("Startup Benchmark")
+        self.timeline.start("startup")
+        mode = "cached" if self.values.get("tmp_cached") else "temporary"
+        self.startup = startup_bench(
+            [artifact.absolute().as_posix()],
+            self.output_path / f"{self.name}.startup",
+            runs,
+        )
+        path = self.output_path / f"{self.name}.startup.json"
+        try:
+            report = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            report = {}
+        report[mode] = dict(
+            self.startup, runs=runs, time=time.strftime("%Y-%m-%d %H:%M:%S")
+        )
+        path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        self.write(startup_report(report))
+
+    def run_profile(self):
+        "Save the import time tree of the built program to <name>.imports.json."
+        exe = self.exe_path
+        if not self.values.get("import_profile"):
+            return
+        elif not (exe and exe.is_file()):
+            self.write(f"import profile skipped, no program to run: {exe}\n")
+            return
+        self.sep("Import Profile")
+        self.timeline.start("profile")
+        roots = profile_imports(
+            [exe.absolute().as_posix()], self.output_path / f"{self.name}.profile"
+        )
+        advice = import_advice(roots, self.values, scan_import_graph(self.file_path))
+        path = self.output_path / f"{self.name}.imports.json"
+        report = {
+            "total": sum(i["cum"] for i in roots),
+            "advice": advice,
+            "tree": roots,
+        }
+        path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        self.write(import_report(roots, advice))
+
+    def store_artifact(self, fingerprint: str = ""):
+        artifact = self.artifact_path
+        if not (self.values.get("artifact_store") and artifact.exists()):
+            return
+        self.sep("Store")
+        self.timeline.start("store")
+        manifest, added = store_add(
+            artifact,
+            self.name,
+            cmd=self.cmd,
+            fingerprint=fingerprint,
+        )
+        self.write(
+            f"stored {manifest['id']} in {artifact_store_path.as_posix()},"
+            f" {added / 1024**2:.1f} MB new of {manifest['size'] / 1024**2:.1f} MB\n"
+        )
+
+    def run_upx(self):
+        # a reused .dist is packed already
+        if not self.upx or self.reused or not self.dist_path.is_dir():
+            return
+        self.sep("UPX Start")
+        self.timeline.start("upx")
+        upx_dist(self.dist_path, self.jobs, self.write)
+        self.sep("UPX Finished")
+
+    def post_build(self, fingerprint: str = ""):
+        app_name = self.name
+        self.run_upx()
+        self.analyze_size()
+        self.store_artifact(fingerprint)
+        self.run_startup()
+        self.run_profile()
+        need_start_file = self.values.get("need_start_file") and not self.values.get(
+            "--onefile"
+        )
+        start_files = {}
+        if need_start_file:
+            for name in [app_name, *self.launchers]:
+                start_files[f"{name}.bat"] = self.output_path / f"{name}.bat"
+                with open(start_files[f"{name}.bat"], "w", encoding="utf-8") as f:
+                    f.write(f"@echo off\ncd {app_name}.dist\nstart /B {name}")
+        if self.values.get("is_compress") and not self.values.get("--onefile"):
+            self.sep("Compress Start")
+            self.timeline.start("compress")
+            src_dir = self.dist_path
+            if src_dir.is_dir():
+                fmt = self.values.get("compress_format") or "zip"
+                compress_dir(
+                    src_dir,
+                    self.output_path / f"{app_name}.{fmt}",
+                    fmt,
+                    start_files,
+                    int(self.values.get("--jobs") or 0),
+                )
+                self.sep("Compress Finished")
+            else:
+                self.write(
+                    f"{src_dir.absolute().as_posix()} is_dir: {src_dir.is_dir()}\n"
+                )
+                self.sep("Compress Skipped")
+
+    def save_timeline(self, resources: dict):
+        try:
+            self.timeline.save(
+                self.output_path / f"{self.name}.timeline",
+                name=self.name,
+                ok=self.ok,
+                jobs=self.jobs,
+                resources=resources,
+            )
+            self.sep("Timeline")
+            self.write(self.timeline.summary())
+            if resources:
+                self.sep("Resources")
+                for stage, item in resources.items():
+                    self.write(
+                        f"{stage:<16}peak {item['rss_peak'] / 1024**3:6.2f} GB"
+                        f"  avg {item['rss_avg'] / 1024**3:6.2f} GB"
+                        f"  {item['cores']:6.2f} cores\n"
+                    )
+            if self.ok and resources:
+                save_resource_history(self.history_key, self.jobs, resources)
+                jobs = suggest_jobs(self.history_key)
+                if jobs:
+                    self.write(f"suggested --jobs={jobs} (used {self.jobs})\n")
+        except OSError:
+            self.write(traceback.format_exc())
+
+    def run(self) -> bool:
+        monitor = ResourceMonitor(self)
+        try:
+            self.output_path.mkdir(parents=True, exist_ok=True)
+            self.log_file = LogFile(self.output_path / f"{self.name}.log")
+            self.timeline = Timeline()
+            monitor.start()
+            stems = [entry.stem for entry in self.entries]
+            if len(set(stems)) < len(stems):
+                # the launchers are told apart by their file names
+                raise ValueError(f"entry points need distinct names: {stems}")
+            fingerprint = ""
+            reuse = self.values.get("build_cache", True)
+            # before the pip dir & prebuilt modules change self.cmd
+            if reuse or self.values.get("artifact_store"):
+                self.timeline.start("fingerprint")
+                fingerprint = self.fingerprint()
+            if reuse and self.reuse_result(fingerprint):
+                self.write(
+                    f"unchanged since last build: {self.result_path.as_posix()}\n"
+                )
+                self.sep("Build Reused")
+                self.reused = True
+            else:
+                self.result_path.unlink(missing_ok=True)
+                if self.can_overlap_pip():
+                    self.run_pip_nuitka()
+                else:
+                    if self.pip_cmd:
+                        self.timeline.start("pip")
+                        pip_dir = self.run_pip()
+                        self.use_pips(pip_dir)
+                        if self.prebuilt:
+                            self.run_prebuilt(pip_dir)
+                    self.run_nuitka()
+                # before the result, a new entry changes the mtime of the .dist
+                self.make_launchers()
+                if fingerprint:
+                    self.save_result(fingerprint)
+            self.post_build(fingerprint)
+            self.sep("Mission Completed")
+            self.ok = True
+        except Exception:
+            self.write(traceback.format_exc())
+            self.sep("Error")
+            self.ok = False
+        finally:
+            monitor.stop()
+            self.monitor_report = monitor.report()
+            self.save_timeline(self.monitor_report)
+            shutil.rmtree(self.pips_path.as_posix(), ignore_errors=True)
+            shutil.rmtree(self.prebuilt_path.as_posix(), ignore_errors=True)
+            if self.log_file:
+                self.log_file.close()
+                self.log_file = None
+        return self.ok
+
+
+def python_tags(pythons: list):
+    "Unique names like py3.12 of the interpreters, for the output subdirs."
+    tags: list = []
+    for python in pythons:
+        version = python_info(python).split()[0]
+        tag = "py" + ".".join(version.split(".")[:2])
+        tags.append(f"{tag}-{len(tags)}" if tag in tags else tag)
+    return tags
+
+
+def build_many(
+    configs: list,
+    parallel: int = 0,
+    cpu_count: int = 0,
+    python_exe: str = "",
+    log=None,
+    rebuild=False,
+    pythons: typing.Sequence = (),
+):
+    "Run several config.json builds at once, splitting the cores by --jobs."
+    log = log or print_log
+    cpu_count = cpu_count or os.cpu_count() or 1
+    # with several interpreters, every config is built into <output>/py3.x by each
+    pythons = list(pythons) or [python_exe]
+    tags = python_tags(pythons) if len(pythons) > 1 else [""]
+    tasks = [(c, py, tag) for c in configs for py, tag in zip(pythons, tags)]
+    # nuitka's python->C stage is single threaded, so a few builds share the cores
+    parallel = parallel or max(1, min(len(tasks), max(cpu_count // 4, len(pythons))))
+    jobs = max(1, cpu_count // parallel)
+    lock = threading.Lock()
+    running: list = []
+
+    def _prefix_log(name):
+        rest = [""]
+
+        def _log(text: str):
+            # the output comes in chunks, only prefix the complete lines
+            lines = (rest[0] + text).splitlines(True)
+            rest[0] = lines.pop() if lines and not lines[-1].endswith("\n") else ""
+            text = "".join(f"[{name}] {line}" for line in lines)
+            if text:
+                with lock:
+                    log(text)
+
+        return _log
+
+    def _run(task):
+        config, python, tag = task
+        values = json.loads(Path(config).read_text(encoding="utf-8"))
+        if tag:
+            output = Path(values.get("--output-dir") or output_path) / tag
+            values["--output-dir"] = output.as_posix()
+        job = BuildJob(values, python_exe=python, jobs=jobs)
+        if rebuild:
+            job.values["build_cache"] = False
+        # the parallel builds share the memory too
+        limit = suggest_jobs(job.history_key, mem_available() // parallel)
+        if limit and limit < jobs:
+            job.set_jobs(limit)
+        job.log = _prefix_log(f"{job.name}@{tag}" if tag else job.name)
+        running.append(job)
+        start = time.perf_counter()
+        job.run()
+        return job, time.perf_counter() - start
+
+    log(f"[build] {len(tasks)} builds, {parallel} parallel, --jobs={jobs}\n")
+    with ThreadPoolExecutor(max_workers=parallel) as pool:
+        futures = [pool.submit(_run, task) for task in tasks]
+        try:
+            return [future.result() for future in futures]
+        except KeyboardInterrupt:
+            # the builds run in their own sessions, Ctrl+C does not reach them
+            for future in futures:
+                future.cancel()
+            for job in running:
+                job.stop()
+            raise
+
+
+def cli_build(argv: list):
+    global PIP_CACHE_SIZE
+    parser = argparse.ArgumentParser(
+        prog="nuitka_simple_gui build",
+        description="Build the config.json files (from dump_config) without GUI.",
+    )
+    parser.add_argument("configs", nargs="+", help="config.json files")
+    parser.add_argument(
+        "-p",
+        "--parallel",
+        type=int,
+        default=0,
+        help="concurrent builds, default to cpu_count // 4",
+    )
+    parser.add_argument(
+        "-c",
+        "--cpu-count",
+        type=int,
+        default=os.cpu_count(),
+        help=f"cores shared by all builds, default to {os.cpu_count()}",
+    )
+    parser.add_argument("--python", default=python_exe_path, help="python executable")
+    parser.add_argument(
+        "--pythons",
+        default="",
+        help="comma separated python executables, build with each into <output>/py3.x",
+    )
+    parser.add_argument(
+        "--pip-cache-size",
+        type=float,
+        default=PIP_CACHE_SIZE / 1024**3,
+        help="GB of the pip dependency cache to keep",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="run nuitka even if the sources and command are unchanged",
+    )
+    args = parser.parse_args(argv)
+    PIP_CACHE_SIZE = int(args.pip_cache_size * 1024**3)
+    try:
+        results = build_many(
+            args.configs,
+            args.parallel,
+            args.cpu_count,
+            args.python,
+            rebuild=args.rebuild,
+            pythons=[i for i in args.pythons.split(",") if i],
+        )
+    except KeyboardInterrupt:
+        print_sep("Cancelled")
+        return 130
+    print_sep("Summary")
+    for job, cost in results:
+        cache = job.compile_cache
+        hits = f"{cache.get('hits', 0)}/{cache.get('hits', 0) + cache.get('misses', 0)}"
+        print(
+            f"{'OK' if job.ok else 'FAIL':<4} {cost:8.1f}s  {job.name:<20}"
+            f" {f'ccache {hits}' if cache else '':<16} {job.output_path.as_posix()}",
+            flush=True,
+        )
+    return 0 if all(job.ok for job, _ in results) else 1
+
+
+class FileWatcher:
+    "Wait for changes of some files, by inotify on Linux or by polling the mtimes."
+
+    def __init__(self, interval: float = WATCH_POLL):
+        self.interval = interval
+        self.paths: set = set()
+        self.snapshot: dict = {}
+        self.fd = -1
+        self.dirs: set = set()
+        self.libc = None
+        if sys.platform.startswith("linux"):
+            try:
+                import ctypes
+                import ctypes.util
+
+                libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+                # IN_NONBLOCK | IN_CLOEXEC
+                fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+                if fd >= 0:
+                    self.libc, self.fd = libc, fd
+            except (OSError, AttributeError):
+                pass
+
+    def watch(self, paths):
+        self.paths = {Path(path).absolute() for path in paths}
+        self.snapshot = self._stat()
+        if self.libc:
+            for path in {path.parent for path in self.paths} - self.dirs:
+                if self.libc.inotify_add_watch(self.fd, bytes(path), INOTIFY_MASK) >= 0:
+                    self.dirs.add(path)
+
+    def _stat(self):
+        snapshot = {}
+        for path in self.paths:
+            try:
+                stat = path.stat()
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                snapshot[path] = None
+        return snapshot
+
+    def wait(self, timeout: float):
+        "Block up to timeout seconds, return the changed paths."
+        deadline = time.monotonic() + timeout
+        while True:
+            remain = max(deadline - time.monotonic(), 0)
+            if self.fd >= 0:
+                if select.select([self.fd], [], [], remain)[0]:
+                    try:
+                        # the events only wake us up, the mtimes tell what changed
+                        os.read(self.fd, 64 * 1024)
+                    except BlockingIOError:
+                        pass
+            else:
+                time.sleep(min(self.interval, remain))
+            snapshot = self._stat()
+            changed = {
+                path for path in self.paths if snapshot[path] != self.snapshot[path]
+            }
+            self.snapshot = snapshot
+            if changed or time.monotonic() >= deadline:
+                return changed
+
+    def wait_quiet(self, timeout: float, debounce: float = WATCH_DEBOUNCE):
+        "Like wait, but keep collecting until no change for debounce seconds."
+        changed = self.wait(timeout)
+        while changed:
+            more = self.wait(debounce)
+            if not more:
+                break
+            changed |= more
+        return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def watch_build(
+    load_values,
+    python_exe: str = "",
+    log=None,
+    stop: typing.Optional[threading.Event] = None,
+    extra_paths=(),
+    started=None,
+):
+    "Build, then rebuild on every change of the entry point and its local imports."
+    log = log or print_log
+    stop = stop or threading.Event()
+    watcher = FileWatcher()
+    job: typing.Optional[BuildJob] = None
+    thread: typing.Optional[threading.Thread] = None
+    try:
+        while not stop.is_set():
+            job = BuildJob(load_values(), python_exe=python_exe, log=log)
+            if started:
+                started(job)
+            if stop.is_set():
+                break
+            paths = job.local_imports() | set(extra_paths)
+            watcher.watch(paths)
+            thread = threading.Thread(target=job.run, daemon=True)
+            thread.start()
+            idle = False
+            changed: set = set()
+            while not stop.is_set() and not changed:
+                changed = watcher.wait_quiet(0.5)
+                if not idle and not thread.is_alive():
+                    idle = True
+                    log(f"[watch] watching {len(paths)} files\n")
+            if thread.is_alive():
+                log("[watch] cancel the running build\n")
+                job.stop()
+                thread.join()
+            for path in sorted(changed):
+                log(f"[watch] changed: {path.as_posix()}\n")
+    finally:
+        if job and thread and thread.is_alive():
+            job.stop()
+            thread.join()
+        watcher.close()
+
+
+def cli_watch(argv: list):
+    parser = argparse.ArgumentParser(
+        prog="nuitka_simple_gui watch",
+        description="Rebuild a config.json on every change of its sources, Ctrl+C to stop.",
+    )
+    parser.add_argument("config", help="config.json file")
+    parser.add_argument("--python", default=python_exe_path, help="python executable")
+    args = parser.parse_args(argv)
+    config = Path(args.config).absolute()
+    try:
+        watch_build(
+            lambda: json.loads(config.read_text(encoding="utf-8")),
+            args.python,
+            extra_paths=[config],
+        )
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+class BuildService:
+    "Priority queue of config.json builds, run by a few workers with warm caches."
+
+    def __init__(self, parallel: int = 1, cpu_count: int = 0, python_exe: str = ""):
+        self.parallel = max(1, parallel)
+        self.jobs = max(1, (cpu_count or os.cpu_count() or 1) // self.parallel)
+        self.python_exe = python_exe or python_exe_path
+        self.queue: list = []
+        self.records: dict = {}
+        self.cond = threading.Condition()
+        self.seq = itertools.count(1)
+        # the state every build would probe again, kept warm for the next jobs
+        if init_plugins():
+            refresh_plugin_cache()
+        self.probe = probe_python(self.python_exe)
+        self.python = python_info(self.python_exe)
+        self.nuitka = nuitka_version(self.python_exe)
+        for _ in range(self.parallel):
+            threading.Thread(target=self._work, daemon=True).start()
+
+    def submit(self, values: dict, priority: int = 0):
+        with self.cond:
+            seq = next(self.seq)
+            record = {
+                "id": str(seq),
+                "name": Path(values.get("file_path") or "").stem,
+                "priority": priority,
+                "state": "queued",
+                "submitted": time.time(),
+                "started": None,
+                "finished": None,
+                "values": values,
+                "log": [],
+                "job": None,
+            }
+            self.records[record["id"]] = record
+            heapq.heappush(self.queue, (-priority, seq, record))
+            finished = [i for i in self.records.values() if i["finished"]]
+            for old in finished[: max(0, len(finished) - SERVICE_HISTORY)]:
+                self.records.pop(old["id"])
+            self.cond.notify_all()
+        return record
+
+    def cancel(self, record: dict):
+        with self.cond:
+            job = record["job"]
+            if record["state"] == "queued":
+                record["state"] = "cancelled"
+                record["finished"] = time.time()
+                self.cond.notify_all()
+        if job and record["state"] == "running":
+            job.stop()
+
+    def _log(self, record: dict, text: str):
+        with self.cond:
+            record["log"].append(text)
+            self.cond.notify_all()
+
+    def _work(self):
+        while True:
+            with self.cond:
+                while not self.queue:
+                    self.cond.wait()
+                _, _, record = heapq.heappop(self.queue)
+                if record["state"] != "queued":
+                    continue
+                try:
+                    job = BuildJob(
+                        record["values"],
+                        python_exe=self.python_exe,
+                        jobs=self.jobs,
+                        log=functools.partial(self._log, record),
+                    )
+                except Exception:
+                    record["log"].append(traceback.format_exc())
+                    record["state"] = "failed"
+                    record["finished"] = time.time()
+                    self.cond.notify_all()
+                    continue
+                record.update(state="running", started=time.time(), job=job)
+            limit = suggest_jobs(job.history_key, mem_available() // self.parallel)
+            if limit and limit < self.jobs:
+                job.set_jobs(limit)
+            job.run()
+            with self.cond:
+                if job.stopping:
+                    record["state"] = "cancelled"
+                else:
+                    record["state"] = "done" if job.ok else "failed"
+                record["finished"] = time.time()
+                self.cond.notify_all()
+
+    def close(self):
+        "Cancel the queued and the running jobs."
+        with self.cond:
+            records = list(self.records.values())
+        for record in records:
+            self.cancel(record)
+
+    def status(self, record: dict):
+        job = record["job"]
+        end = record["finished"] or time.time()
+        return {
+            "id": record["id"],
+            "name": record["name"],
+            "priority": record["priority"],
+            "state": record["state"],
+            "submitted": record["submitted"],
+            "seconds": round(end - record["started"], 3) if record["started"] else 0,
+            "artifact": job.artifact_path.as_posix() if job else "",
+            "compile_cache": job.compile_cache if job else {},
+        }
+
+    def info(self):
+        with self.cond:
+            states = collections.Counter(i["state"] for i in self.records.values())
+        return {
+            "python": self.python,
+            "nuitka": self.nuitka,
+            "compilers": self.probe.get("text", ""),
+            "parallel": self.parallel,
+            "jobs": self.jobs,
+            "states": states,
+        }
+
+    def follow(self, record: dict, offset: int = 0):
+        "Yield the log chunks from offset until the job is finished."
+        while True:
+            with self.cond:
+                while len(record["log"]) <= offset and not record["finished"]:
+                    self.cond.wait(1)
+                chunks = record["log"][offset:]
+                finished = record["finished"]
+            offset += len(chunks)
+            if chunks:
+                yield "".join(chunks)
+            if finished and not chunks:
+                return
+
+
+class BuildServiceHandler(BaseHTTPRequestHandler):
+    """
+    GET    /                  service info
+    GET    /jobs              all the jobs
+    POST   /jobs?priority=N   queue a config.json (the body), higher priority first
+    GET    /jobs/<id>         job status
+    GET    /jobs/<id>/log     stream the log until the job is finished
+    DELETE /jobs/<id>         cancel
+    """
+
+    server: typing.Any
+
+    def log_message(self, format, *args):
+        pass
+
+    def _allowed(self):
+        "Only local clients with the token, never a web page: configs run code."
+        if self.headers.get("Origin"):
+            self._send_json({"error": "cross-origin requests are refused"}, 403)
+            return False
+        token = self.headers.get("Authorization") or ""
+        if not hmac.compare_digest(
+            token.encode(), f"Bearer {self.server.token}".encode()
+        ):
+            self._send_json({"error": "bad or missing token"}, 401)
+            return False
+        return True
+
+    def _send_json(self, data, code: int = 200):
+        body = json.dumps(data, default=str).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self):
+        if not self._allowed():
+            return None
+        url = urlsplit(self.path)
+        parts = [i for i in url.path.split("/") if i]
+        record = None
+        if len(parts) > 1 and parts[0] == "jobs":
+            record = self.server.service.records.get(parts[1])
+            if not record:
+                self._send_json({"error": "job not found"}, 404)
+                return None
+        return parts, parse_qs(url.query), record
+
+    def do_GET(self):
+        route = self._route()
+        if not route:
+            return
+        service = self.server.service
+        parts, query, record = route
+        if not parts:
+            self._send_json(service.info())
+        elif parts == ["jobs"]:
+            records = list(service.records.values())
+            self._send_json([service.status(i) for i in records])
+        elif record and len(parts) == 2:
+            self._send_json(service.status(record))
+        elif record and parts[2:] == ["log"]:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.end_headers()
+            offset = int(query.get("offset", ["0"])[0])
+            try:
+                for text in service.follow(record, offset):
+                    self.wfile.write(text.encode("utf-8"))
+                    self.wfile.flush()
+            except OSError:
+                pass
+        else:
+            self._send_json({"error": "not found"}, 404)
+
+    def do_POST(self):
+        route = self._route()
+        if not route:
+            return
+        parts, query, _ = route
+        if parts != ["jobs"]:
+            return self._send_json({"error": "not found"}, 404)
+        content_type = self.headers.get("Content-Type") or ""
+        if content_type.split(";")[0].strip().lower() != "application/json":
+            return self._send_json(
+                {"error": "Content-Type must be application/json"}, 415
+            )
+        try:
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            values = json.loads(body)
+            priority = int(query.get("priority", ["0"])[0])
+        except ValueError as error:
+            return self._send_json({"error": str(error)}, 400)
+        service = self.server.service
+        self._send_json(service.status(service.submit(values, priority)), 201)
+
+    def do_DELETE(self):
+        route = self._route()
+        if not route:
+            return
+        _, _, record = route
+        if not record:
+            return self._send_json({"error": "not found"}, 404)
+        self.server.service.cancel(record)
+        self._send_json(self.server.service.status(record))
+
+
+def is_loopback(host: str):
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def service_token(port: int, create=False):
+    "The bearer token of the service on port, readable by the current user only."
+    path = app_cache_path / f"service-{port}.token"
+    if not create:
+        return path.read_text(encoding="utf-8").strip()
+    token = secrets.token_urlsafe(32)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(token)
+    return token
+
+
+def cli_serve(argv: list):
+    parser = argparse.ArgumentParser(
+        prog="nuitka_simple_gui serve",
+        description="Local build service, "
+        + " ".join(BuildServiceHandler.__doc__.split()),
+    )
+    parser.add_argument(
+        "--host", default=SERVICE_ADDRESS[0], help="a loopback address only"
+    )
+    parser.add_argument("--port", type=int, default=SERVICE_ADDRESS[1])
+    parser.add_argument(
+        "-p", "--parallel", type=int, default=1, help="concurrent builds"
+    )
+    parser.add_argument(
+        "-c",
+        "--cpu-count",
+        type=int,
+        default=os.cpu_count(),
+        help=f"cores shared by all builds, default to {os.cpu_count()}",
+    )
+    parser.add_argument("--python", default=python_exe_path, help="python executable")
+    args = parser.parse_args(argv)
+    if not is_loopback(args.host):
+        # anyone reaching the port could run code through pip_args / --other-args
+        parser.error(f"--host must be a loopback address, not {args.host}")
+    server = ThreadingHTTPServer((args.host, args.port), BuildServiceHandler)
+    server.daemon_threads = True
+    server.token = service_token(server.server_address[1], create=True)
+    server.service = BuildService(args.parallel, args.cpu_count, args.python)
+    print(f"serving on http://{args.host}:{args.port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.close()
+        (app_cache_path / f"service-{server.server_address[1]}.token").unlink(
+            missing_ok=True
+        )
+    return 0
+
+
+def cli_submit(argv: list):
+    parser = argparse.ArgumentParser(
+        prog="nuitka_simple_gui submit",
+        description="Queue a config.json on the build service and stream its log.",
+    )
+    parser.add_argument("config", help="config.json file")
+    parser.add_argument("--priority", type=int, default=0, help="higher runs first")
+    parser.add_argument(
+        "--server", default="http://%s:%s" % SERVICE_ADDRESS, help="service url"
+    )
+    parser.add_argument("--detach", action="store_true", help="do not wait")
+    parser.add_argument(
+        "--token", default="", help="default to the token file written by serve"
+    )
+    args = parser.parse_args(argv)
+    server = args.server.rstrip("/")
+    try:
+        token = args.token or service_token(urlsplit(server).port or 80)
+    except OSError as error:
+        print(f"[submit] no token: {error}", file=sys.stderr, flush=True)
+        return 1
+    headers = {"Authorization": f"Bearer {token}"}
+
+    def _request(url, data=None):
+        if data is not None:
+            return urllib.request.Request(
+                url,
+                data=data,
+                headers=dict(headers, **{"Content-Type": "application/json"}),
+            )
+        return urllib.request.Request(url, headers=headers)
+
+    request = _request(
+        f"{server}/jobs?priority={args.priority}", Path(args.config).read_bytes()
+    )
+    try:
+        with urllib.request.urlopen(request) as resp:
+            status = json.loads(resp.read())
+        print(f"[submit] job {status['id']} {status['state']}", flush=True)
+        if args.detach:
+            return 0
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        with urllib.request.urlopen(
+            _request(f"{server}/jobs/{status['id']}/log")
+        ) as resp:
+            while True:
+                chunk = resp.read1(LOG_CHUNK_SIZE)
+                if not chunk:
+                    break
+                sys.stdout.write(decoder.decode(chunk))
+                sys.stdout.flush()
+        with urllib.request.urlopen(_request(f"{server}/jobs/{status['id']}")) as resp:
+            status = json.loads(resp.read())
+    except (OSError, urllib.error.URLError) as error:
+        print(f"[submit] {server}: {error}", file=sys.stderr, flush=True)
+        return 1
+    print(f"[submit] job {status['id']} {status['state']}", flush=True)
+    return 0 if status["state"] == "done" else 1
+
+
+def find_ccache():
+    "The ccache for gcc / clang: NUITKA_CCACHE_BINARY, PATH, or the usual places."
+    path = os.environ.get("NUITKA_CCACHE_BINARY") or shutil.which("ccache")
+    if path:
+        return Path(path).as_posix()
+    for path in CCACHE_LOCATIONS:
+        if os.access(path, os.X_OK):
+            return path
+    return ""
+
+
+def ccache_size(ccache: str, path: Path):
+    "Size of a ccache dir by its own stats files, None if ccache can't tell."
+    env = dict(os.environ, CCACHE_DIR=str(path))
+    # ccache 4 has --print-stats, ccache 3 only the human -s
+    for args in (["--print-stats"], ["-s"]):
+        try:
+            output = subprocess.run(
+                [ccache, *args], env=env, capture_output=True, check=True, timeout=30
+            ).stdout.decode("utf-8", "replace")
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"^cache_size_kibibyte\s+(\d+)", output, re.M)
+        if match:
+            return int(match.group(1)) * 1024
+        # "cache size  1.2 GB" (3.x), "Cache size (GiB): 1.2 / 5.0" (4.x)
+        match = re.search(
+            r"^\s*cache size(?: \((\w+)\))?:?\s+([\d.]+)\s*(\w*)", output, re.M | re.I
+        )
+        if match:
+            unit = (match.group(1) or match.group(3)).upper().removesuffix("B")
+            return int(float(match.group(2)) * CCACHE_SIZE_UNITS.get(unit, 1))
+    return None
+
+
+def compiler_cache_size():
+    "Bytes in the ccache dirs of nuitka, by the ccache stats instead of a walk."
+    ccache = find_ccache()
+    if IS_WIN32 or not ccache:
+        return None
+    total = 0
+    for path in (nuitka_cache_path / "ccache").glob("*"):
+        if path.is_dir():
+            size = ccache_size(ccache, path)
+            if size is None:
+                return None
+            total += size
+    return total
+
+
+def _read_compile_history():
+    try:
+        return json.loads(compile_history_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def path_size(path: Path):
+    if path.is_dir():
+        return get_dir_size(path)
+    return path.stat().st_size if path.is_file() else 0
+
+
+def _bench_cases(apps: list, matrix: dict):
+    names = sorted(matrix)
+    for app in apps:
+        for combo in itertools.product(*(matrix[k] for k in names)):
+            options = dict(zip(names, combo))
+            label = ",".join(f"{k}={v}" for k, v in options.items())
+            yield f"{app}[{label}]", app, options
+
+
+def run_bench(
+    apps: list,
+    matrix: dict,
+    output: Path,
+    python_exe: str = "",
+    repeat: int = 1,
+    log=None,
+):
+    "Build the BENCH_APPS with each combination of the matrix, return {case: result}."
+    log = log or print_log
+    python_exe = python_exe or python_exe_path
+    src_dir = output / "apps"
+    src_dir.mkdir(parents=True, exist_ok=True)
+    results = {}
+    for case, app, options in _bench_cases(apps, matrix):
+        source, requires, extra = BENCH_APPS[app]
+        if requires and subprocess.call(
+            [python_exe, "-c", f"import {requires}"], stderr=subprocess.DEVNULL
+        ):
+            log(f"[bench] skip {case}: {requires} is not installed\n")
+            continue
+        entry = src_dir / f"bench_{app}.py"
+        entry.write_text(source, encoding="utf-8")
+        values = dict(BENCH_BASE_VALUES, **extra, **options)
+        values["file_path"] = entry.as_posix()
+        values["build_cache"] = False
+        case_id = hashlib.md5(case.encode("utf-8")).hexdigest()[:8]
+        values["--output-dir"] = (output / app / case_id).as_posix()
+        best: dict = {}
+        for _ in range(repeat):
+            shutil.rmtree(values["--output-dir"], ignore_errors=True)
+            job = BuildJob(values, python_exe=python_exe, log=lambda text: None)
+            start = time.perf_counter()
+            job.run()
+            wall = time.perf_counter() - start
+            exe = job.exe_path
+            if job.ok and not job.startup and exe and exe.is_file():
+                # the .dist cases too, their cold runs get an empty home & temp dir
+                job.startup = startup_bench(
+                    [exe.absolute().as_posix()],
+                    Path(values["--output-dir"]) / "startup",
+                    BENCH_STARTUP_RUNS,
+                )
+            resources = job.monitor_report
+            result = {
+                "ok": job.ok,
+                "wall": round(wall, 3),
+                "rss_peak": max((i["rss_peak"] for i in resources.values()), default=0),
+                "size": path_size(job.artifact_path),
+                "cache_hit_rate": None,
+            }
+            for phase, stats in job.startup.items():
+                result[f"startup_{phase}"] = stats["exit"].get("p50")
+            hits = job.compile_cache.get("hits", 0)
+            misses = job.compile_cache.get("misses", 0)
+            if hits + misses:
+                result["cache_hit_rate"] = round(hits / (hits + misses), 3)
+            if not best or (result["ok"] and result["wall"] < best["wall"]):
+                best = result
+        results[case] = best
+        log(
+            f"[bench] {'OK' if best['ok'] else 'FAIL':<4} {best['wall']:8.1f}s"
+            f" {best['rss_peak'] / 1024**2:8.0f} MB rss"
+            f" {best['size'] / 1024**2:8.1f} MB  {case}\n"
+        )
+    return results
+
+
+def compare_bench(results: dict, baseline: dict, threshold: float = 0.1):
+    "Lines of the cases slower / bigger than the baseline by more than threshold."
+    regressions = []
+    for case, result in results.items():
+        base = baseline.get(case)
+        if not base or not base.get("ok"):
+            continue
+        if not result["ok"]:
+            regressions.append(f"{case}: build failed")
+            continue
+        for key in ["wall", "rss_peak", "size", "startup_cold", "startup_warm"]:
+            old, new = base.get(key) or 0, result.get(key) or 0
+            if old and new and (new - old) / old > threshold:
+                regressions.append(
+                    f"{case}: {key} {old} -> {new} (+{(new - old) / old:.0%})"
+                )
+    return regressions
+
+
+def cli_bench(argv: list):
+    parser = argparse.ArgumentParser(
+        prog="nuitka_simple_gui bench",
+        description="Build the bundled sample apps over an option matrix, offline.",
+    )
+    parser.add_argument(
+        "--apps",
+        default=",".join(BENCH_APPS),
+        help=f"comma separated, default to {','.join(BENCH_APPS)}",
+    )
+    parser.add_argument(
+        "--matrix",
+        default="",
+        help='json file or text like {"--onefile": [false, true]}',
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="keep the fastest run")
+    parser.add_argument("--output", default="nuitka_bench", help="work dir")
+    parser.add_argument("--python", default=python_exe_path, help="python executable")
+    parser.add_argument("--baseline", default="", help="baseline json to compare")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="save the results as --baseline"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="regression ratio, default 0.1"
+    )
+    args = parser.parse_args(argv)
+    matrix = BENCH_MATRIX
+    if args.matrix:
+        path = Path(args.matrix)
+        matrix = json.loads(path.read_text() if path.is_file() else args.matrix)
+    output = Path(args.output).absolute()
+    results = run_bench(
+        [i for i in args.apps.split(",") if i],
+        matrix,
+        output,
+        args.python,
+        args.repeat,
+    )
+    report = {
+        "python": python_info(args.python),
+        "nuitka": nuitka_version(args.python),
+        "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "results": results,
+    }
+    (output / "bench.json").write_text(json.dumps(report, indent=2))
+    code = 0 if all(i["ok"] for i in results.values()) else 1
+    if args.baseline:
+        baseline_path = Path(args.baseline)
+        if args.save_baseline:
+            baseline_path.write_text(json.dumps(report, indent=2))
+            print(f"baseline saved: {baseline_path}", flush=True)
+        elif baseline_path.is_file():
+            baseline = json.loads(baseline_path.read_text())
+            regressions = compare_bench(results, baseline["results"], args.threshold)
+            print_sep("Regressions" if regressions else "No Regression")
+            if regressions:
+                print("\n".join(regressions), flush=True)
+                code = 1
+    return code
+
+
+def start_build():
+    global RUNNING_JOB, WATCH_STOP
+    window["Start"].update(disabled=True)
+    window["Cancel"].update(disabled=False)
+    if values_cache.get("watch"):
+        WATCH_STOP = threading.Event()
+
+        def _started(job):
+            global RUNNING_JOB
+            # Quit stops the build of the watch loop like any other, or it is orphaned
+            RUNNING_JOB = job
+
+        watch_build(lambda: values_cache, stop=WATCH_STOP, started=_started)
+        WATCH_STOP = None
+        RUNNING_JOB = None
+    else:
+        RUNNING_JOB = BuildJob(values_cache)
+        if RUNNING_JOB.run() and IS_WIN32:
+            beep()
+        RUNNING_JOB = None
+    window["Start"].update(disabled=False)
+    window["Cancel"].update(disabled=True)
+
+
+def beep():
+    import ctypes
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    frequency = 800
+    duration = 200
+    for _ in range(3):
+        kernel32.Beep(frequency, duration)
+
+
+def main(argv: typing.Optional[list] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["build"]:
+        return cli_build(argv[1:])
+    elif argv[:1] == ["cache"]:
+        return cli_cache(argv[1:])
+    elif argv[:1] == ["bench"]:
+        return cli_bench(argv[1:])
+    elif argv[:1] == ["scan"]:
+        return cli_scan(argv[1:])
+    elif argv[:1] == ["size"]:
+        return cli_size(argv[1:])
+    elif argv[:1] == ["profile"]:
+        return cli_profile(argv[1:])
+    elif argv[:1] == ["store"]:
+        return cli_store(argv[1:])
+    elif argv[:1] == ["watch"]:
+        return cli_watch(argv[1:])
+    elif argv[:1] == ["serve"]:
+        return cli_serve(argv[1:])
+    elif argv[:1] == ["submit"]:
+        return cli_submit(argv[1:])
+    plugins_stale = init_plugins()
+    layout = [
+        input_path("Entry Point:", "file_path", disable_input=True),
+        input_path("More Entries:", "entry_points", action=sg.FilesBrowse),
+        [
             sg.Text(
                 "Output Name:",
                 size=(10, None),
@@ -572,6 +4206,14 @@ Unchecked: `--onefile-cache-mode=temporary`, to clear the tempdir after each run
                 enable_events=True,
                 disabled=True,
             ),
+            sg.Input(
+                "",
+                key="startup_runs",
+                size=(3, None),
+                tooltip="Startup benchmark: run the onefile binary N times cold & warm after the build",
+                enable_events=True,
+                disabled=True,
+            ),
         ],
         init_checkbox(),
         [
@@ -585,6 +4227,11 @@ Unchecked: `--onefile-cache-mode=temporary`, to clear the tempdir after each run
                 tooltip="separate by Space",
                 enable_events=True,
             ),
+            sg.Button(
+                "scan",
+                key="scan_imports",
+                tooltip="Fill the includes by the imports of the Entry Point",
+            ),
         ],
         [
             sg.Text(
@@ -611,7 +4258,23 @@ Unchecked: `--onefile-cache-mode=temporary`, to clear the tempdir after each run
                 tooltip="separate by , (comma)",
             ),
         ],
-        input_path("Pip Args:".ljust(20), "pip_args", sg.FilesBrowse),
+        input_path("Pip Args:".ljust(20), "pip_args", sg.FilesBrowse)
+        + [
+            sg.Checkbox(
+                "cache",
+                key="pip_cache",
+                default=True,
+                tooltip=f"Reuse the pip target dir from {pip_cache_path}",
+                enable_events=True,
+            ),
+            sg.Input(
+                "",
+                key="prebuilt",
+                size=(20, None),
+                tooltip=f"Packages of the pip dir to compile once by --module and ship as extension modules, separate by Space, cached in {prebuilt_cache_path}",
+                enable_events=True,
+            ),
+        ],
         [
             sg.Text(
                 "Output Path:",
@@ -626,9 +4289,45 @@ Unchecked: `--onefile-cache-mode=temporary`, to clear the tempdir after each run
         ],
         [
             sg.Button("Start", size=(None, 10)),
+            sg.Checkbox(
+                "reuse",
+                key="build_cache",
+                default=True,
+                tooltip="Skip nuitka if the command and the local sources are unchanged",
+                enable_events=True,
+            ),
+            sg.Checkbox(
+                "watch",
+                key="watch",
+                default=False,
+                tooltip="Rebuild on every change of the Entry Point and its local imports, until Cancel",
+                enable_events=True,
+            ),
+            sg.Checkbox(
+                "profile",
+                key="import_profile",
+                default=False,
+                tooltip="Run the built program with PYTHONPROFILEIMPORTTIME=1 and report the slow imports",
+                enable_events=True,
+            ),
             sg.Button("Cancel", disabled=True),
             sg.Button("Quit"),
+            sg.Checkbox(
+                "store",
+                key="artifact_store",
+                default=False,
+                tooltip=f"Keep this build as deduplicated blobs in {artifact_store_path}",
+                enable_events=True,
+            ),
             sg.Checkbox("Compress", key="is_compress", enable_events=True),
+            sg.Combo(
+                COMPRESS_FORMATS,
+                default_value="zip",
+                key="compress_format",
+                size=(7, None),
+                readonly=True,
+                enable_events=True,
+            ),
             sg.Checkbox(
                 "shortcut.bat",
                 key="need_start_file",
@@ -654,6 +4353,12 @@ Unchecked: `--onefile-cache-mode=temporary`, to clear the tempdir after each run
                 tooltip="Open NUITKA_CACHE_DIR",
                 enable_events=True,
             ),
+            sg.Button(
+                "gc",
+                key="nuitka_cache_gc",
+                tooltip="Remove least recently used files of NUITKA_CACHE_DIR",
+                enable_events=True,
+            ),
         ],
         [
             sg.Output(
@@ -683,32 +4388,11 @@ Unchecked: `--onefile-cache-mode=temporary`, to clear the tempdir after each run
             shutil.rmtree(output_path)
 
     def kill_proc(event, values):
-        def _kill_windows_proc(pid):
-            for _ in range(4):
-                with subprocess.Popen(
-                    f'wmic process where "parentprocessid={pid}" get processid',
-                    shell=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                ) as p:
-                    for _pid in re.findall(b"[0-9]+", p.stdout.read()):
-                        _kill_windows_proc(int(_pid))
-            try:
-                os.kill(pid, 9)
-            except OSError:
-                pass
-
-        global STOPPING_PROC
-        if RUNNING_PROC:
-            STOPPING_PROC = True
-            if IS_WIN32:
-                return _kill_windows_proc(RUNNING_PROC.pid)
-            for f in [RUNNING_PROC.terminate, RUNNING_PROC.kill]:
-                f()
-                try:
-                    RUNNING_PROC.wait(timeout=1)
-                except subprocess.TimeoutExpired:
-                    continue
+        if WATCH_STOP:
+            WATCH_STOP.set()
+        if RUNNING_JOB:
+            # waits for the process tree to exit, off the GUI thread
+            threading.Thread(target=RUNNING_JOB.stop, daemon=True).start()
 
     def dump_config(event, values):
         _path = sg.popup_get_file(
@@ -756,8 +4440,7 @@ Unchecked: `--onefile-cache-mode=temporary`, to clear the tempdir after each run
         print("cache_dir:", nuitka_cache_path, flush=True)
         if IS_WIN32:
             proc = subprocess.Popen(["explorer", nuitka_cache_path])
-        size = get_dir_size(Path(nuitka_cache_path))
-        print(f"{nuitka_cache_path}: {size / 1024**3:.1f} GB", flush=True)
+        threading.Thread(target=show_nuitka_cache, daemon=True).start()
         machine = platform.machine()
         print("platform.machine():", machine)
         if IS_WIN32:
@@ -766,6 +4449,42 @@ Unchecked: `--onefile-cache-mode=temporary`, to clear the tempdir after each run
             print("\n".join(download_mingw_urls), flush=True)
             proc.wait()
 
+    def nuitka_cache_gc(event, values):
+        text = sg.popup_get_text(
+            f"Remove least recently used files of {nuitka_cache_path} down to (GB):",
+            title="nuitka_cache_gc",
+            default_text=str(NUITKA_CACHE_SIZE // 1024**3),
+        )
+        if not text:
+            return
+        try:
+            limit = int(float(text) * 1024**3)
+        except ValueError:
+            return sg.popup_error(f"Bad size: {text}")
+        threading.Thread(target=show_nuitka_cache, args=(limit,), daemon=True).start()
+
+    def scan_imports(event, values):
+        if not values.get("file_path"):
+            return sg.popup_error("Choose the Entry Point first.")
+        entry = Path(values["file_path"])
+        with_external = not (values.get("pip_args") or "").strip()
+
+        def _scan():
+            try:
+                start = time.perf_counter()
+                graph = scan_import_graph(entry)
+                result = propose_includes(graph, with_external)
+                print(
+                    f"scan: {len(graph['edges'])} local modules, "
+                    f"{time.perf_counter() - start:.2f}s",
+                    flush=True,
+                )
+                window.write_event_value("scan_imports_done", result)
+            except Exception:
+                traceback.print_exc()
+
+        threading.Thread(target=_scan, daemon=True).start()
+
     actions = {
         "View": view_folder,
         "Remove": rm_cache_dir,
@@ -773,13 +4492,34 @@ Unchecked: `--onefile-cache-mode=temporary`, to clear the tempdir after each run
         "dump_config": dump_config,
         "load_config": load_config,
         "nuitka_cache": nuitka_cache,
+        "nuitka_cache_gc": nuitka_cache_gc,
+        "scan_imports": scan_imports,
     }
+    log_pump = LogPump(window["output"])
+    sys.stdout = sys.stderr = log_pump
     error = None
-    ensure_python_path()
+    if plugins_stale:
+        threading.Thread(target=refresh_stale_plugins, daemon=True).start()
+    start_probe()
     window.write_event_value("--output-dir", output_path.as_posix())
     while True:
         try:
-            event, values = window.read()
+            event, values = window.read(timeout=LOG_FRAME_MS)
+            log_pump.pump()
+            if event == sg.TIMEOUT_KEY:
+                continue
+            if event == "probe_done":
+                probe = values.pop(event)
+                if not ensure_python_path(probe):
+                    error = probe.get("error") or f"{python_exe_path} -m nuitka failed"
+                    break
+            elif event == "scan_imports_done":
+                packages, modules = values.pop(event)
+                window["--include-package"].update(" ".join(packages))
+                window["--include-module"].update(" ".join(modules))
+                # refresh the cmd with the new values
+                window.write_event_value("--include-package", " ".join(packages))
+                continue
             if values:
                 values_cache.update(values)
             # print(event, values, flush=True, file=old_stderr)
@@ -788,14 +4528,15 @@ Unchecked: `--onefile-cache-mode=temporary`, to clear the tempdir after each run
                 callback(event, values)
                 continue
             if event == sg.WIN_CLOSED or event == "Quit":
-                if RUNNING_PROC:
-                    RUNNING_PROC.kill()
-                    RUNNING_PROC.wait()
+                if WATCH_STOP:
+                    WATCH_STOP.set()
+                if RUNNING_JOB:
+                    RUNNING_JOB.stop()
                 break
             # window['output'].update(values)
             update_plugin_list(event, values)
             update_cmd(event, values)
-            if event == "Start" and not RUNNING_PROC:
+            if event == "Start" and not RUNNING_JOB:
                 threading.Thread(target=start_build, daemon=True).start()
         except BaseException:
             error = traceback.format_exc()
@@ -809,4 +4550,4 @@ Unchecked: `--onefile-cache-mode=temporary`, to clear the tempdir after each run
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
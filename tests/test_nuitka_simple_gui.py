@@ -0,0 +1,359 @@
+import json
+import os
+import sys
+import tarfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import nuitka_simple_gui as nsg
+
+
+def write(path: Path, size: int = 0, age: float = 0, data: bytes = b""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data or b"x" * size)
+    if age:
+        mtime = time.time() - age
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_cache_gc_lru_entries(tmp_path):
+    write(tmp_path / "downloads/gcc/13.2/bin/gcc", 1000, age=500)
+    write(tmp_path / "downloads/gcc/14.1/bin/gcc", 1000, age=10)
+    write(tmp_path / "downloads/gcc/13.2/lib/libgcc.a", 1000, age=5)
+    write(tmp_path / "bytecode/a.bytecode", 1000, age=400)
+    write(tmp_path / "onefile/old.bin", 1000, age=300)
+    scan = nsg.scan_cache(tmp_path)
+    removed, freed = nsg.cache_gc(scan, 3000, root=tmp_path)
+    assert (removed, freed) == (2, 2000)
+    # a download goes as a whole, by the last use of any of its files
+    assert (tmp_path / "downloads/gcc/13.2/bin/gcc").is_file()
+    assert (tmp_path / "downloads/gcc/14.1").is_dir()
+    assert not (tmp_path / "bytecode/a.bytecode").exists()
+    assert not (tmp_path / "onefile/old.bin").exists()
+
+
+def test_cache_gc_simple_gui(tmp_path):
+    root = tmp_path / "cache"
+    app = root / "simple_gui"
+    write(app / "upx/settings/old", 1000, age=500)
+    write(app / "upx/settings/new", 1000, age=10)
+    write(app / "upx/settings/busy.1.2.tmp", 1000, age=900)
+    write(app / "modules/fastlib-1.0-abc/fastlib.so", 1000, age=400)
+    write(app / "modules/tmp1234.tmp/fastlib.so", 1000, age=900)
+    write(app / "pips/key/fastlib.py", 1000, age=900)
+    write(app / "imports.json", 10, age=900)
+    store = app / "store"
+    src = tmp_path / "src"
+    write(src / "app.bin", data=os.urandom(1000))
+    old, _ = nsg.store_add(src, "app", store=store)
+    write(src / "app.bin", data=os.urandom(1000))
+    new, _ = nsg.store_add(src, "app", store=store)
+    path = nsg._store_manifest_path(store, old["id"])
+    manifest = json.loads(path.read_text())
+    manifest["created"] -= 300
+    path.write_text(json.dumps(manifest))
+    scan = nsg.scan_cache(root)
+    removed, freed = nsg.cache_gc(scan, 6000, root=root)
+    # the old stored build counts the blob only it used
+    assert (removed, freed) == (3, 3000)
+    assert not (app / "upx/settings/old").exists()
+    assert (app / "upx/settings/new").is_file()
+    assert not (app / "modules/fastlib-1.0-abc").exists()
+    assert [i["id"] for i in nsg._store_manifests(store)] == [new["id"]]
+    # the pips have their own LRU, the files of running builds are kept
+    assert (app / "pips/key/fastlib.py").is_file()
+    assert (app / "upx/settings/busy.1.2.tmp").is_file()
+    assert (app / "modules/tmp1234.tmp/fastlib.so").is_file()
+    assert (app / "imports.json").is_file()
+
+
+def test_store_add_checkout_gc(tmp_path):
+    store = tmp_path / "store"
+    dist = tmp_path / "app.dist"
+    write(dist / "app.bin", data=b"\x7fELF binary")
+    write(dist / "lib/data.txt", data=b"data")
+    if not nsg.IS_WIN32:
+        os.chmod(dist / "app.bin", 0o755)
+    first, added = nsg.store_add(dist, "app", store=store)
+    assert added == len(b"\x7fELF binary") + len(b"data")
+    second, added = nsg.store_add(dist, "app", store=store)
+    assert added == 0
+    assert first["id"] != second["id"]
+    target = tmp_path / "checkout"
+    nsg.store_checkout(first["id"], target, store=store)
+    assert (target / "lib/data.txt").read_bytes() == b"data"
+    if not nsg.IS_WIN32:
+        assert os.access(target / "app.bin", os.X_OK)
+    write(dist / "lib/data.txt", data=b"changed")
+    nsg.store_add(dist, "app", store=store)
+    assert nsg.store_gc(store, keep=1) == len(b"data")
+    assert len(nsg._store_manifests(store)) == 1
+
+
+def test_store_ids_unique(tmp_path):
+    store = tmp_path / "store"
+    write(tmp_path / "app.bin", data=b"same content")
+    with ThreadPoolExecutor(8) as pool:
+        ids = list(
+            pool.map(
+                lambda _: nsg.store_add(tmp_path / "app.bin", "app", store=store)[0][
+                    "id"
+                ],
+                range(16),
+            )
+        )
+    assert len(set(ids)) == 16
+    assert len(nsg._store_manifests(store)) == 16
+
+
+def test_store_gc_keeps_temp_blobs(tmp_path):
+    store = tmp_path / "store"
+    live = write(store / "blobs/ab/abcd.1.2.tmp", 10)
+    stale = write(store / "blobs/ab/abce.1.2.tmp", 10, age=7200)
+    unused = write(store / "blobs/ab/abcf", 10)
+    assert nsg.store_gc(store) == 20
+    assert live.is_file()
+    assert not stale.exists()
+    assert not unused.exists()
+
+
+def test_make_cmd_multidist(tmp_path):
+    entry, tool = tmp_path / "app.py", tmp_path / "tool.py"
+    values = {
+        "file_path": entry.as_posix(),
+        "entry_points": f"{tool.as_posix()}; {entry.as_posix()}",
+        "--output-dir": (tmp_path / "out").as_posix(),
+        "--standalone": True,
+        "--include-package": "pkg1 pkg2",
+        "_plugin_tk-inter": True,
+    }
+    cmd, pip_cmd, file_path, output_path = nsg.make_cmd(values, "python")
+    assert cmd[:3] == ["python", "-m", "nuitka"]
+    assert cmd[-2:] == [f"--main={entry.as_posix()}", f"--main={tool.as_posix()}"]
+    assert entry.as_posix() not in cmd
+    assert "--include-package=pkg1" in cmd and "--include-package=pkg2" in cmd
+    assert "--enable-plugin=tk-inter" in cmd
+    assert pip_cmd == []
+    assert (file_path, output_path) == (entry, tmp_path / "out")
+
+
+def test_make_cmd_prebuilt(tmp_path):
+    values = {
+        "file_path": (tmp_path / "app.py").as_posix(),
+        "--output-dir": (tmp_path / "out").as_posix(),
+        "--standalone": True,
+        "pip_args": "fastlib==1.2",
+        "prebuilt": "fastlib",
+    }
+    cmd, pip_cmd, _, _ = nsg.make_cmd(values, "python")
+    pips = (tmp_path / "out/app.pips").as_posix()
+    prebuilt = (tmp_path / "out/app.prebuilt").as_posix()
+    assert pip_cmd == ["python", "-m", "pip", "install", "fastlib==1.2", "-t", pips]
+    assert f"--include-raw-dir={pips}=./" in cmd
+    assert f"--include-raw-dir={prebuilt}=./" in cmd
+    for pattern in ["fastlib/*.py", "fastlib/*.pyc", "fastlib.py"]:
+        assert f"--noinclude-data-files={pattern}" in cmd
+    assert cmd[-1] == (tmp_path / "app.py").as_posix()
+
+
+def test_compare_bench():
+    baseline = {
+        "a": {"ok": True, "wall": 10, "rss_peak": 100, "size": 50, "startup_cold": 1},
+        "b": {"ok": True, "wall": 10},
+        "c": {"ok": False, "wall": 10},
+    }
+    results = {
+        "a": {"ok": True, "wall": 10.5, "rss_peak": 200, "size": 50, "startup_cold": 2},
+        "b": {"ok": False, "wall": 1},
+        "c": {"ok": True, "wall": 100},
+        "d": {"ok": True, "wall": 100},
+    }
+    assert nsg.compare_bench(results, baseline, 0.1) == [
+        "a: rss_peak 100 -> 200 (+100%)",
+        "a: startup_cold 1 -> 2 (+100%)",
+        "b: build failed",
+    ]
+
+
+def test_parse_importtime():
+    text = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 |     _codecs",
+            "import time:       200 |        300 |   codecs",
+            "import time:        50 |        350 | encodings",
+            "import time:        10 |         10 | json",
+            "not an import line",
+        ]
+    )
+    roots = nsg.parse_importtime(text)
+    assert [(i["module"], i["cum"]) for i in roots] == [
+        ("encodings", 350),
+        ("json", 10),
+    ]
+    codecs = roots[0]["children"][0]
+    assert (codecs["module"], codecs["self"]) == ("codecs", 200)
+    assert [i["module"] for i in codecs["children"]] == ["_codecs"]
+
+
+@pytest.mark.skipif(nsg.IS_WIN32, reason="shell scripts as fake ccache")
+@pytest.mark.parametrize(
+    "stats, print_stats, expected",
+    [
+        ("", "cache_size_kibibyte 2048\n", 2048 * 1024),
+        ("cache size                           1.5 GB\n", "", int(1.5 * 1000**3)),
+        ("  Cache size (GiB): 0.50 / 5.00 (10.00%)\n", "", int(0.5 * 1024**3)),
+        ("  Cache size (GB):    2.00 /  5.00 (40.00%)\n", "", 2 * 1000**3),
+        ("nothing to see\n", "", None),
+    ],
+)
+def test_ccache_size(tmp_path, stats, print_stats, expected):
+    (tmp_path / "stats").write_text(stats)
+    (tmp_path / "print-stats").write_text(print_stats)
+    ccache = tmp_path / "ccache"
+    # ccache 3 has no --print-stats
+    ccache.write_text(
+        "#!/bin/sh\n"
+        'if [ "$1" = "--print-stats" ]; then\n'
+        f"  [ -s {tmp_path}/print-stats ] || exit 1\n"
+        f"  cat {tmp_path}/print-stats\n"
+        "else\n"
+        f"  cat {tmp_path}/stats\n"
+        "fi\n"
+    )
+    ccache.chmod(0o755)
+    assert nsg.ccache_size(ccache.as_posix(), tmp_path) == expected
+
+
+def make_dist(root: Path):
+    dist = root / "app.dist"
+    write(dist / "app.bin", data=b"\x7fELF" + os.urandom(1000))
+    write(dist / "lib/ext.so", data=os.urandom(2000))
+    write(dist / "lib/data.txt", data=b"text " * 1000)
+    write(dist / "big.dat", data=b"big " * 100_000)
+    (dist / "empty").mkdir()
+    return dist
+
+
+def test_compress_zip(tmp_path, monkeypatch):
+    # big.dat is streamed, the others read ahead
+    monkeypatch.setattr(nsg, "ZIP_READ_AHEAD_FILE", 100_000)
+    dist = make_dist(tmp_path)
+    start_bat = write(tmp_path / "start.bat", data=b"@echo off")
+    target = tmp_path / "app.zip"
+    nsg.compress_dir(dist, target, extra_files={"start.bat": start_bat}, workers=2)
+    with zipfile.ZipFile(target) as zf:
+        assert zf.testzip() is None
+        infos = {i.filename: i for i in zf.infolist()}
+        for path in [p for p in dist.rglob("*") if p.is_file()]:
+            arcname = path.relative_to(tmp_path).as_posix()
+            assert zf.read(arcname) == path.read_bytes()
+        assert zf.read("start.bat") == b"@echo off"
+    assert "app.dist/empty/" in infos
+    assert infos["app.dist/lib/ext.so"].compress_type == zipfile.ZIP_STORED
+    assert infos["app.dist/lib/data.txt"].compress_type == zipfile.ZIP_DEFLATED
+    assert infos["app.dist/big.dat"].compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_compress_tar_xz(tmp_path, monkeypatch):
+    # the tarfile fallback without the xz binary
+    monkeypatch.setattr(nsg.shutil, "which", lambda name: None)
+    dist = make_dist(tmp_path)
+    target = tmp_path / "app.tar.xz"
+    nsg.compress_dir(dist, target, "tar.xz")
+    with tarfile.open(target) as tf:
+        data = tf.extractfile("app.dist/lib/data.txt").read()
+        assert data == (dist / "lib/data.txt").read_bytes()
+        assert "app.dist/empty" in tf.getnames()
+
+
+def test_size_kind_binaries(tmp_path):
+    dist = make_dist(tmp_path)
+    write(dist / "LICENSE", data=b"MIT")
+    binaries = nsg.find_binaries(dist)
+    assert binaries == {"app.bin"}
+    assert nsg.size_kind("app.bin", binaries) == "executable"
+    assert nsg.size_kind("LICENSE", binaries) == "data"
+    assert nsg.size_kind("lib/ext.so", binaries) == "extension"
+    assert nsg.size_kind("libpython3.so.1.0", binaries) == "dll"
+
+
+def test_scan_import_graph_threads(tmp_path, monkeypatch):
+    monkeypatch.setattr(nsg, "import_cache_path", tmp_path / "cache/imports.json")
+    write(tmp_path / "app/main.py", data=b"import pkg.mod\nimport json\n")
+    write(tmp_path / "app/pkg/__init__.py", data=b"from . import other\n")
+    write(tmp_path / "app/pkg/mod.py", data=b"from fastlib.sub import thing\n")
+    write(tmp_path / "app/pkg/other.py", data=b"")
+    entry = tmp_path / "app/main.py"
+
+    def scan(_):
+        return nsg.scan_import_graph(entry)
+
+    with ThreadPoolExecutor(8) as pool:
+        graphs = list(pool.map(scan, range(32)))
+    for graph in graphs:
+        assert {p.name for p in graph["edges"]} == {
+            "main.py",
+            "__init__.py",
+            "mod.py",
+            "other.py",
+        }
+        assert graph["external"] == {"json", "fastlib.sub", "fastlib.sub.thing"}
+    assert json.loads(nsg.import_cache_path.read_text())
+    assert list(nsg.import_cache_path.parent.glob("*.tmp")) == []
+    packages, modules = nsg.propose_includes(graphs[0], with_external=False)
+    assert (packages, modules) == (["pkg"], [])
+
+
+def test_resolve_modules(tmp_path):
+    names = ["json", "email.mime", "pytest", "nuitka.utils.Utils.getOS", "nothing"]
+    assert nsg.resolve_modules(names, sys.executable, tmp_path) == {
+        "pytest": "pytest",
+        "nuitka.utils.Utils.getOS": "nuitka.utils.Utils",
+    }
+
+
+def test_pip_cache_put_threads(tmp_path, monkeypatch):
+    monkeypatch.setattr(nsg, "pip_cache_path", tmp_path / "pips")
+    sources = []
+    for index in range(6):
+        src = write(tmp_path / f"build{index}/app.pips/fastlib/__init__.py", 100)
+        sources.append(src.parent.parent)
+    with ThreadPoolExecutor(6) as pool:
+        paths = list(
+            pool.map(lambda src: nsg.pip_cache_put("key", src, ["fastlib"]), sources)
+        )
+    assert set(paths) == {tmp_path / "pips/key"}
+    assert (tmp_path / "pips/key/fastlib/__init__.py").is_file()
+    assert sorted(i.name for i in (tmp_path / "pips").iterdir()) == ["key", "key.json"]
+    assert nsg.pip_cache_get("key") == tmp_path / "pips/key"
+
+
+def test_log_file_threads(tmp_path):
+    log = nsg.LogFile(tmp_path / "app.log", max_bytes=4096)
+    line = "x" * 63 + "\n"
+
+    def _write():
+        for _ in range(2000):
+            # flush and check the size on every write
+            log.flushed = 0
+            log.write(line)
+
+    threads = [threading.Thread(target=_write) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    log.close()
+    # a late write of the other thread is dropped
+    log.write(line)
+    names = sorted(i.name for i in tmp_path.iterdir())
+    assert names == ["app.log", "app.log.1", "app.log.2", "app.log.3"]
+    for path in tmp_path.iterdir():
+        assert set(path.read_text().splitlines()) <= {line.strip()}